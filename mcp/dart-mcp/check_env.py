@@ -210,12 +210,19 @@ def check_dependencies():
         "OpenDartReader": "opendartreader",
         "httpx": "httpx",
         "bs4": "beautifulsoup4",
+        "lxml": "lxml",
         "dotenv": "python-dotenv"
     }
     
     optional_packages = {
         "openai": "openai",
-        "pdfplumber": "pdfplumber"
+        "pdfplumber": "pdfplumber",
+        "pymupdf": "pymupdf",
+        "selectolax": "selectolax",
+        "ahocorasick": "pyahocorasick",
+        "regex": "regex",
+        "h2": "h2",
+        "orjson": "orjson"
     }
     
     all_ok = True
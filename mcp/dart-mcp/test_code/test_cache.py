@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+"""DartCache 일괄 조회/저장 및 캐싱 대상 판단 테스트"""
+import os
+import sys
+
+# 상위 디렉토리를 path에 추가 (test_code의 상위인 dart-mcp 디렉토리)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from utils.cache import CachedFunction, DartCache, _is_cacheable
+
+
+@pytest.mark.asyncio
+async def test_mset_then_mget_round_trip(tmp_path):
+    cache = DartCache(cache_dir=str(tmp_path))
+    params_list = [{"start_date": "2024-01-01"}, {"start_date": "2024-04-01"}, {"start_date": "2024-07-01"}]
+    
+    await cache.mset("search", [(params_list[0], [{"rcept_no": "1"}]), (params_list[2], [{"rcept_no": "3"}])])
+    
+    assert await cache.mget("search", params_list) == [[{"rcept_no": "1"}], None, [{"rcept_no": "3"}]]
+    # 파일 캐시에서도 같은 값이 조회되는지 (메모리 캐시를 비운 새 인스턴스)
+    reloaded = DartCache(cache_dir=str(tmp_path))
+    assert await reloaded.mget("search", params_list) == [[{"rcept_no": "1"}], None, [{"rcept_no": "3"}]]
+    assert await reloaded.get("search", params_list[0]) == [{"rcept_no": "1"}]
+
+
+@pytest.mark.parametrize("result", [None, [], {}, "", {"error": "x"}, '{"error": "DART API 오류"}'])
+def test_empty_and_error_results_are_not_cacheable(result):
+    assert not _is_cacheable(result)
+
+
+@pytest.mark.parametrize("result", [[{"rcept_no": "1"}], {"list": []}, '{"result": "ok"}'])
+def test_regular_results_are_cacheable(result):
+    assert _is_cacheable(result)
+
+
+@pytest.mark.asyncio
+async def test_cached_function_skips_empty_result(tmp_path):
+    cache = DartCache(cache_dir=str(tmp_path))
+    calls = []
+    
+    @CachedFunction(cache)
+    async def search(query):
+        calls.append(query)
+        return []
+    
+    await search("삼성전자")
+    await search("삼성전자")
+    
+    assert calls == ["삼성전자", "삼성전자"]
+    assert cache.stats["saves"] == 0
@@ -0,0 +1,23 @@
+#!/usr/bin/env python
+"""쿼리 기업명 추출 테스트"""
+import os
+import sys
+
+# 상위 디렉토리를 path에 추가 (test_code의 상위인 dart-mcp 디렉토리)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.corp_code_mapper import CorpCodeMapper
+
+
+def test_overlapping_suffix_patterns_are_unioned():
+    # 업종 접미사 패턴별로 따로 스캔하므로 "자동차"와 "그룹" 매칭이 모두 남음
+    companies = CorpCodeMapper().extract_companies_from_query("가나자동차그룹 합병 공시")
+    
+    assert "가나자동차" in companies
+    assert "가나자동차그룹" in companies
+
+
+def test_duplicates_removed_in_first_seen_order():
+    companies = CorpCodeMapper().extract_companies_from_query("삼성전자 삼성전자 005930")
+    
+    assert companies == ["005930", "삼성전자"]
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""DocumentFilter LLM 선별 결과 캐시 테스트"""
+import os
+import sys
+import types
+
+# 상위 디렉토리를 path에 추가 (test_code의 상위인 dart-mcp 디렉토리)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from utils.cache import DartCache
+from workflow.utils.document_filter import DocumentFilter
+
+
+class FakeLLM:
+    """chat.completions.create 호출 수를 세고 정해진 응답을 돌려주는 가짜 클라이언트"""
+    
+    def __init__(self, reply: str):
+        self.calls = 0
+        self.chat = types.SimpleNamespace(completions=types.SimpleNamespace(create=self._create))
+        self._reply = reply
+    
+    def _create(self, **kwargs):
+        self.calls += 1
+        message = types.SimpleNamespace(content=self._reply)
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+
+def _search_results():
+    # 호출마다 새 dict를 만들어 캐시가 인덱스로 현재 검색 결과를 다시 가리키는지 확인
+    return [
+        {"_uid": f"2024010100000{i}", "report_nm": f"보고서{i}", "corp_name": "테스트", "rcept_dt": "20240101"}
+        for i in range(8)
+    ]
+
+
+def _make_filter(tmp_path, reply: str) -> DocumentFilter:
+    doc_filter = DocumentFilter(FakeLLM(reply))
+    doc_filter.cache = DartCache(cache_dir=str(tmp_path))
+    return doc_filter
+
+
+@pytest.mark.asyncio
+async def test_cached_selection_maps_onto_new_search_results(tmp_path):
+    doc_filter = _make_filter(tmp_path, '{"relevant_indices": [1, 3], "reason": "관련"}')
+    
+    first = await doc_filter.filter_documents("합병 공시", _search_results(), {})
+    second_results = _search_results()
+    second = await doc_filter.filter_documents("합병 공시", second_results, {})
+    
+    assert doc_filter.llm_client.calls == 1
+    assert [doc["_uid"] for doc in first] == [doc["_uid"] for doc in second]
+    assert second[0] is second_results[1]
+    assert second[1] is second_results[3]
+
+
+@pytest.mark.asyncio
+async def test_fallback_selection_is_not_cached(tmp_path):
+    doc_filter = _make_filter(tmp_path, "응답을 파싱할 수 없음")
+    
+    first = await doc_filter.filter_documents("합병 공시", _search_results(), {})
+    await doc_filter.filter_documents("합병 공시", _search_results(), {})
+    
+    assert len(first) == 5
+    assert doc_filter.llm_client.calls == 2
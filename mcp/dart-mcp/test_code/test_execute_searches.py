@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""DartOrchestrator._execute_searches 누적 중복 제거 및 조기 중단 테스트"""
+import asyncio
+import json
+import os
+import sys
+import types
+
+# 상위 디렉토리를 path에 추가 (test_code의 상위인 dart-mcp 디렉토리)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from utils.cache import DartCache
+from workflow.dart_orchestrator import DartOrchestrator
+
+# 구간 i는 접수번호 i*2 ~ i*2+3을 반환 (이웃 구간과 2건씩 겹침)
+PERIODS = [
+    {"bgn_de": f"2024{month:02d}01", "end_de": f"2024{month:02d}28", "pblntf_detail_ty": "B001"}
+    for month in range(1, 9)
+]
+
+
+def _period_results(period: int):
+    return [
+        {"rcept_no": f"{n:014d}", "corp_name": "테스트", "rcept_dt": f"2024{period + 1:02d}{n % 28 + 1:02d}"}
+        for n in range(period * 2, period * 2 + 4)
+    ]
+
+
+@pytest.fixture
+def orchestrator(tmp_path):
+    """검색 API와 캐시만 가짜로 채운 오케스트레이터 (LLM/DART 초기화 생략)"""
+    started, cancelled = [], []
+    
+    async def search_company_disclosures(company, start_date, end_date, pblntf_detail_ty):
+        period = int(start_date[5:7]) - 1
+        started.append(period)
+        try:
+            # 뒤 구간일수록 늦게 끝나도록 해 조기 중단 시 진행 중인 검색이 남게 함
+            await asyncio.sleep(0.01 * (period + 1))
+        except asyncio.CancelledError:
+            cancelled.append(period)
+            raise
+        return json.dumps(_period_results(period))
+    
+    orch = DartOrchestrator.__new__(DartOrchestrator)
+    orch.dart_api = types.SimpleNamespace(search_company_disclosures=search_company_disclosures)
+    orch.query_expander = types.SimpleNamespace(create_search_params=lambda expanded_query: PERIODS)
+    orch.cache = DartCache(cache_dir=str(tmp_path))
+    orch.started, orch.cancelled = started, cancelled
+    return orch
+
+
+@pytest.mark.asyncio
+async def test_early_stop_cancels_remaining_periods(orchestrator):
+    results = await orchestrator._execute_searches({"corp_codes": ["00126380"]}, max_results=5)
+    
+    # 구간 0(4건) + 구간 1(새 문서 2건) = 6건에서 중단하고 최신 5건 반환
+    uids = [result["_uid"] for result in results]
+    assert len(uids) == 5
+    assert len(set(uids)) == 5
+    
+    # 동시 검색은 최대 5개라 마지막 구간은 시작 전에 취소되고, 진행 중이던 검색도 모두 취소
+    assert len(orchestrator.started) < len(PERIODS)
+    assert sorted(orchestrator.cancelled) == sorted(set(orchestrator.started) - {0, 1})
+    
+    # 끝난 구간만 캐시에 저장
+    cached = await orchestrator.cache.mget(
+        "search_company_disclosures",
+        [orchestrator._build_cache_params(params) for params in PERIODS]
+    )
+    assert [entry is not None for entry in cached] == [True, True] + [False] * 6
+
+
+@pytest.mark.asyncio
+async def test_parallel_search_deduplicates_all_periods(orchestrator):
+    expanded_query = {"search_strategy": {"parallel_search": True}}
+    
+    results = await orchestrator._execute_searches(expanded_query, max_results=100)
+    
+    # 8개 구간 모두 검색, 겹치는 접수번호는 한 번만 포함 (0 ~ 17)
+    assert sorted(orchestrator.started) == list(range(8))
+    assert sorted(result["_uid"] for result in results) == [f"{n:014d}" for n in range(18)]
+    # 최신순 정렬
+    dates = [result["rcept_dt"] for result in results]
+    assert dates == sorted(dates, reverse=True)
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+"""RateLimiter 윈도우 호출 수 제한 테스트"""
+import os
+import sys
+
+# 상위 디렉토리를 path에 추가 (test_code의 상위인 dart-mcp 디렉토리)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bisect
+import types
+
+import pytest
+
+from utils import rate_limiter
+from utils.rate_limiter import RateLimiter
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """time.monotonic/asyncio.sleep을 가짜 시계로 대체 (sleep하면 시계만 진행)"""
+    clock = {"now": 1000.0}
+    
+    async def fake_sleep(seconds):
+        clock["now"] += seconds
+    
+    monkeypatch.setattr(rate_limiter, "time", types.SimpleNamespace(monotonic=lambda: clock["now"]))
+    monkeypatch.setattr(rate_limiter.asyncio, "sleep", fake_sleep)
+    return clock
+
+
+@pytest.mark.asyncio
+async def test_burst_of_max_calls_is_not_throttled(fake_clock):
+    limiter = RateLimiter(max_calls=100, time_window=60, burst_limit=20)
+    
+    waits = [await limiter.acquire() for _ in range(100)]
+    
+    assert max(waits) == 0
+    assert limiter.stats["throttled_calls"] == 0
+    assert await limiter.acquire() == pytest.approx(60)
+
+
+@pytest.mark.asyncio
+async def test_no_window_admits_more_than_max_calls(fake_clock):
+    limiter = RateLimiter(max_calls=100, time_window=60)
+    
+    admitted = []
+    for i in range(350):
+        # 중간중간 시계를 조금씩 진행시켜 버스트와 지속 호출을 섞음
+        if i % 7 == 0:
+            fake_clock["now"] += 0.3
+        await limiter.acquire()
+        admitted.append(fake_clock["now"])
+    
+    for i, start in enumerate(admitted):
+        in_window = bisect.bisect_left(admitted, start + 60) - i
+        assert in_window <= 100
@@ -25,6 +25,7 @@ from pathlib import Path
 # OpenDartReader 임포트 시도
 try:
     import OpenDartReader
+    import requests
     opendart_available = True
 except ImportError:
     OpenDartReader = None
@@ -38,10 +39,81 @@ logger = get_logger("dart-mcp")
 # API 키 (환경변수에서 로드)
 DART_API_KEY = os.getenv("DART_API_KEY")
 
+
+# 공시 목록 조회(list.json) 엔드포인트
+DART_LIST_URL = "https://opendart.fss.or.kr/api/list.json"
+
 # OpenDartReader 객체 초기화
 dart_reader = None
+_list_session = None
 if OpenDartReader and DART_API_KEY:
     dart_reader = OpenDartReader(DART_API_KEY)
+    # 공시 목록 조회는 커넥션 풀을 가진 전용 Session으로 직접 호출 (기간별 검색마다 TCP/TLS 재연결 방지)
+    _list_session = requests.Session()
+    _list_session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=20))
+
+
+def _get_list_page(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    list.json 한 페이지 조회
+    
+    013(조회된 데이터 없음) 외의 오류 상태는 OpenDartReader와 같이 ValueError로 올려
+    호출자의 오류 처리(_handle_dart_error)로 전달합니다.
+    """
+    response = _list_session.get(DART_LIST_URL, params=params, timeout=30)
+    response.raise_for_status()
+    data = response.json()
+    status = data.get('status')
+    if status not in ('000', '013'):
+        raise ValueError({'status': status, 'message': data.get('message')})
+    return data
+
+
+def _list_disclosures(
+    corp_code: str = "",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    kind: str = "",
+    kind_detail: str = "",
+    final: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    DART list.json을 직접 호출해 공시 목록을 조회 (OpenDartReader.list와 같은 파라미터/페이징)
+    
+    Args:
+        corp_code: 고유번호 (빈 문자열이면 전체 기업)
+        start: 시작일자 (YYYY-MM-DD, 기본값: 1900-01-01)
+        end: 종료일자 (YYYY-MM-DD, 기본값: 당일)
+        kind: 공시 종류 코드
+        kind_detail: 상세 공시유형 코드
+        final: 최종보고서만 조회 여부
+        
+    Returns:
+        공시 목록 (레코드 dict 리스트)
+    """
+    params = {
+        'crtfc_key': DART_API_KEY,
+        'corp_code': corp_code,
+        'bgn_de': start.replace('-', '') if start else '19000101',
+        'end_de': end.replace('-', '') if end else datetime.today().strftime('%Y%m%d'),
+        'last_reprt_at': 'Y' if final else 'N',
+        'page_no': 1,
+        'page_count': 100,
+    }
+    if kind:
+        params['pblntf_ty'] = kind
+    if kind_detail:
+        params['pblntf_detail_ty'] = kind_detail
+    
+    data = _get_list_page(params)
+    if 'list' not in data:
+        return []
+    
+    results = data['list']
+    for page in range(2, data.get('total_page', 1) + 1):
+        params['page_no'] = page
+        results.extend(_get_list_page(params).get('list', []))
+    return results
 
 # YAML 파일에서 필드 매핑 로드
 def load_field_mappings():
@@ -326,9 +398,13 @@ async def search_company_disclosures(
         
         # 공시 목록 조회 (기업 지정 없으면 모든 기업)
         if company:
-            result = dart_reader.list(company, **kwargs)
+            corp_code = dart_reader.find_corp_code(company)
+            if not corp_code:
+                raise ValueError(f'could not find "{company}"')
         else:
-            result = dart_reader.list(**kwargs)
+            corp_code = ''
+        # 동기 HTTP 호출은 스레드에서 실행 (여러 기간 검색이 이벤트 루프를 막지 않고 겹쳐 실행되고 취소도 가능)
+        result = await asyncio.to_thread(_list_disclosures, corp_code, **kwargs)
             
         return _serialize_dataframe(result)
         
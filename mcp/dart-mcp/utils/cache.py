@@ -7,7 +7,7 @@ import json
 import hashlib
 import os
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import pickle
 from pathlib import Path
@@ -30,6 +30,8 @@ class DartCache:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.ttl = timedelta(hours=ttl_hours)
         self.memory_cache = {}  # 메모리 캐시
+        # 디버깅용: 캐시 항목에 함수명/파라미터까지 저장
+        self.debug = os.getenv("DART_CACHE_DEBUG", "0") == "1"
         
         # 캐시 통계
         self.stats = {
@@ -40,7 +42,7 @@ class DartCache:
         
         logger.info(f"Cache initialized: {self.cache_dir} (TTL: {ttl_hours}h)")
     
-    def _generate_key(self, function_name: str, params: Dict[str, Any]) -> str:
+    def _generate_key(self, function_name: str, params: Dict[str, Any]) -> bytes:
         """
         캐시 키 생성
         
@@ -49,21 +51,22 @@ class DartCache:
             params: 파라미터 딕셔너리
             
         Returns:
-            해시된 캐시 키
+            해시된 캐시 키 (raw digest bytes, 메모리 캐시 키로 그대로 사용)
         """
         # 파라미터를 정렬하여 일관된 키 생성
         sorted_params = json.dumps(params, sort_keys=True, ensure_ascii=False)
         key_string = f"{function_name}:{sorted_params}"
         
-        # MD5 해시로 키 생성
-        return hashlib.md5(key_string.encode()).hexdigest()
+        # BLAKE2b 해시로 키 생성 (hex 변환은 파일 경로를 만들 때만 수행)
+        return hashlib.blake2b(key_string.encode(), digest_size=16).digest()
     
-    def _get_cache_path(self, cache_key: str) -> Path:
+    def _get_cache_path(self, cache_key: bytes) -> Path:
         """캐시 파일 경로 반환"""
+        key_hex = cache_key.hex()
         # 첫 2글자로 서브디렉토리 생성 (분산 저장)
-        subdir = self.cache_dir / cache_key[:2]
+        subdir = self.cache_dir / key_hex[:2]
         subdir.mkdir(exist_ok=True)
-        return subdir / f"{cache_key}.cache"
+        return subdir / f"{key_hex}.cache"
     
     def _is_valid(self, timestamp: float) -> bool:
         """캐시 유효성 검사"""
@@ -81,8 +84,26 @@ class DartCache:
         Returns:
             캐시된 데이터 또는 None
         """
-        cache_key = self._generate_key(function_name, params)
+        return self._lookup(function_name, self._generate_key(function_name, params))
+    
+    async def mget(self, function_name: str, params_list: List[Dict[str, Any]]) -> List[Optional[Any]]:
+        """
+        여러 파라미터에 대한 캐시 데이터를 한 번에 조회
         
+        Args:
+            function_name: 함수명
+            params_list: 파라미터 리스트
+            
+        Returns:
+            params_list 순서와 동일한 캐시된 데이터 (없으면 None) 리스트
+        """
+        return [
+            self._lookup(function_name, self._generate_key(function_name, params))
+            for params in params_list
+        ]
+    
+    def _lookup(self, function_name: str, cache_key: bytes) -> Optional[Any]:
+        """캐시 키로 메모리 캐시 → 파일 캐시 순서로 조회"""
         # 1. 메모리 캐시 확인
         if cache_key in self.memory_cache:
             entry = self.memory_cache[cache_key]
@@ -130,14 +151,31 @@ class DartCache:
             params: 파라미터
             data: 저장할 데이터
         """
+        self._store(function_name, params, data)
+    
+    async def mset(self, function_name: str, items: List[Tuple[Dict[str, Any], Any]]) -> None:
+        """
+        여러 (파라미터, 데이터) 쌍을 한 번에 캐시에 저장
+        
+        Args:
+            function_name: 함수명
+            items: (파라미터, 저장할 데이터) 튜플 리스트
+        """
+        for params, data in items:
+            self._store(function_name, params, data)
+    
+    def _store(self, function_name: str, params: Dict[str, Any], data: Any) -> None:
+        """메모리 캐시와 파일 캐시에 저장"""
         cache_key = self._generate_key(function_name, params)
         
+        # params는 이미 캐시 키(파일명)에 반영되어 있으므로 기본적으로 저장하지 않음
         entry = {
             "timestamp": time.time(),
-            "function": function_name,
-            "params": params,
             "data": data
         }
+        if self.debug:
+            entry["function"] = function_name
+            entry["params"] = params
         
         # 1. 메모리 캐시에 저장
         self.memory_cache[cache_key] = entry
@@ -202,22 +240,36 @@ class DartCache:
         total_requests = self.stats["hits"] + self.stats["misses"]
         hit_rate = (self.stats["hits"] / total_requests * 100) if total_requests > 0 else 0
         
-        # 캐시 크기 계산
-        cache_size = sum(
-            f.stat().st_size for f in self.cache_dir.rglob("*.cache")
-        )
+        # 캐시 크기/파일 수 계산 (디렉토리 1회 순회)
+        cache_size = 0
+        cache_files = 0
+        for cache_file in self.cache_dir.rglob("*.cache"):
+            cache_size += cache_file.stat().st_size
+            cache_files += 1
         
         return {
             "hits": self.stats["hits"],
             "misses": self.stats["misses"],
             "saves": self.stats["saves"],
             "hit_rate": f"{hit_rate:.1f}%",
-            "cache_files": len(list(self.cache_dir.rglob("*.cache"))),
+            "cache_files": cache_files,
             "cache_size_mb": f"{cache_size / 1024 / 1024:.1f}",
             "memory_entries": len(self.memory_cache)
         }
 
 
+def _is_cacheable(result: Any) -> bool:
+    """결과가 캐싱 가능한지 판단 (빈 결과와 에러 응답 제외)"""
+    if not result:
+        return False
+    if isinstance(result, str):
+        # 에러 메시지는 앞부분에 나타나므로 전체 문자열을 스캔하지 않음
+        return "error" not in result[:200]
+    if isinstance(result, dict):
+        return "error" not in result
+    return True
+
+
 class CachedFunction:
     """함수 캐싱 데코레이터"""
     
@@ -245,7 +297,7 @@ class CachedFunction:
             result = await func(*args, **kwargs)
             
             # 결과 캐싱 (에러가 아닌 경우만)
-            if result and not (isinstance(result, str) and "error" in result):
+            if _is_cacheable(result):
                 await self.cache.set(function_name, params, result)
             
             return result
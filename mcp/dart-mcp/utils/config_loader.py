@@ -44,7 +44,9 @@ class Config:
             
             # 처리 설정
             "parallel_downloads": int(os.getenv("DART_PARALLEL_DOWNLOADS", "5")),
+            "max_concurrent_fetches": int(os.getenv("DART_MAX_CONCURRENT_FETCHES", "3")),
             "parse_timeout": int(os.getenv("DART_PARSE_TIMEOUT", "30000")),
+            "pretty_json": os.getenv("DART_PRETTY_JSON", "true").lower() == "true",  # 심층 검색 결과 JSON 들여쓰기
             
             # LLM 설정
             "llm_provider": os.getenv("LLM_PROVIDER", "openai"),  # openai, vllm, claude
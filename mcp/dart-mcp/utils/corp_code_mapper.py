@@ -4,9 +4,178 @@
 """
 
 import re
-from typing import Optional, List, Dict, Any
+from collections import defaultdict
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
 import json
 
+# Aho-Corasick (선택적) - 알려진 기업명을 쿼리 1회 스캔으로 매칭
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
+
+# regex 모듈이 있으면 쿼리 패턴 매칭에 사용 (re와 호환되는 대체 엔진, 선택적)
+try:
+    import regex as _pattern_re
+except ImportError:
+    _pattern_re = re
+
+# 종목코드 패턴 (6자리 숫자)
+_STOCK_CODE_RE = _pattern_re.compile(r'\b\d{6}\b')
+_STOCK_CODE_FULL_RE = _pattern_re.compile(r'^\d{6}$')
+
+# 기업명 패턴 (한글 2자 이상 + 업종 접미사)
+# "OO전자", "OO화학" 등의 패턴 (접미사가 겹치는 이름도 모두 찾도록 패턴별로 따로 스캔)
+_COMPANY_PATTERN_RES = tuple(_pattern_re.compile(pattern) for pattern in (
+    r'[가-힣]+(?:전자|화학|제약|바이오|엔터|건설|중공업|자동차|은행|증권|생명|화재|카드)',
+    r'[가-힣]+(?:케미칼|케미컬|에너지|모빌리티|솔루션)',
+    r'[가-힣]+(?:홀딩스|그룹|지주)',
+))
+
+# 주요 기업명 패턴
+# 알려진 대기업들 (확장 가능)
+_KNOWN_COMPANIES = (
+    "삼성전자", "SK하이닉스", "LG전자", "현대차", "현대자동차", "기아",
+    "네이버", "카카오", "쿠팡", "배달의민족", "우아한형제들",
+    "포스코", "POSCO", "현대제철", "롯데케미칼",
+    "삼성물산", "삼성생명", "삼성화재", "삼성증권", "삼성카드",
+    "LG화학", "LG디스플레이", "LG이노텍", "LG유플러스",
+    "SK텔레콤", "SKT", "SK이노베이션", "SK에너지",
+    "한국전력", "한전", "KT", "케이티",
+    "현대건설", "대우건설", "GS건설",
+    "신한은행", "국민은행", "우리은행", "하나은행", "기업은행",
+    "삼성바이오로직스", "셀트리온", "한미약품",
+    "대한항공", "아시아나항공", "제주항공",
+    "CJ제일제당", "CJ ENM", "CJ대한통운",
+    "아모레퍼시픽", "LG생활건강",
+    "현대모비스", "한국타이어", "현대위아",
+    "두산", "두산중공업", "두산인프라코어",
+    "한화", "한화솔루션", "한화에어로스페이스",
+    "엔씨소프트", "넥슨", "넷마블", "크래프톤", "펄어비스",
+    "현대중공업", "삼성중공업", "대우조선해양",
+    "SK바이오팜", "SK바이오사이언스",
+    "카카오뱅크", "카카오페이", "토스", "비바리퍼블리카"
+)
+
+# (소문자 기업명, 원래 기업명) - 쿼리마다 .lower()를 반복하지 않도록 미리 계산
+_KNOWN_LOWER = tuple((company.lower(), company) for company in _KNOWN_COMPANIES)
+
+
+def _build_known_company_pattern() -> str:
+    """
+    알려진 기업명 alternation 패턴 생성
+    
+    기업명을 첫 글자별로 묶어 "삼(?:성전자|성물산|...)" 형태로 만들면
+    각 위치에서 첫 글자가 맞는 묶음만 시도하므로 대부분의 후보를 한 번에 건너뜀.
+    묶음 안에서는 길이 내림차순으로 두어 위치마다 가장 긴 기업명이 선택되도록 함
+    """
+    buckets: Dict[str, List[str]] = defaultdict(list)
+    for company_lower, _ in _KNOWN_LOWER:
+        buckets[company_lower[0]].append(company_lower[1:])
+    
+    alternatives = []
+    for first_char, rests in buckets.items():
+        rests.sort(key=len, reverse=True)
+        alternatives.append(
+            re.escape(first_char) + "(?:" + "|".join(re.escape(rest) for rest in rests) + ")"
+        )
+    return "|".join(alternatives)
+
+
+# 알려진 기업명 단일 정규식 (Aho-Corasick 미설치 시 사용)
+# lookahead로 감싸 모든 위치에서 가장 긴 기업명을 찾고,
+# 같은 위치에서 시작하는 더 짧은 기업명(예: "두산중공업" -> "두산")은 아래 테이블로 보충
+_KNOWN_COMPANY_RE = re.compile("(?=(" + _build_known_company_pattern() + "))")
+
+# 소문자 기업명 -> 그 이름의 접두어인 알려진 기업명들 (자기 자신 포함)
+_KNOWN_PREFIX_MATCHES = {
+    company_lower: tuple(
+        other for other_lower, other in _KNOWN_LOWER if company_lower.startswith(other_lower)
+    )
+    for company_lower, _ in _KNOWN_LOWER
+}
+
+
+def _build_substring_index() -> Dict[str, Tuple[str, ...]]:
+    """소문자 기업명의 모든 부분 문자열(2글자 이상) -> 해당 기업명들 인덱스 생성"""
+    index: Dict[str, Dict[str, None]] = defaultdict(dict)
+    for company_lower, company in _KNOWN_LOWER:
+        for start in range(len(company_lower)):
+            for end in range(start + 2, len(company_lower) + 1):
+                index[company_lower[start:end]][company] = None
+    return {substring: tuple(companies) for substring, companies in index.items()}
+
+
+# 부분 매칭용 인덱스 - 단어마다 전체 기업명을 스캔하지 않고 dict 조회 1회로 후보를 찾음
+_KNOWN_SUBSTRING_INDEX = _build_substring_index()
+
+
+def _build_company_automaton():
+    """알려진 기업명으로 Aho-Corasick 오토마톤 생성"""
+    automaton = ahocorasick.Automaton()
+    for company_lower, company in _KNOWN_LOWER:
+        automaton.add_word(company_lower, company)
+    automaton.make_automaton()
+    return automaton
+
+
+_COMPANY_AUTOMATON = _build_company_automaton() if AHOCORASICK_AVAILABLE else None
+
+
+@lru_cache(maxsize=1024)
+def _extract_companies(query: str) -> Tuple[str, ...]:
+    """
+    CorpCodeMapper.extract_companies_from_query 본체
+    
+    쿼리 문자열에만 의존하는 순수 함수이므로 쿼리 단위로 캐싱
+    """
+    companies = []
+    
+    # 종목코드 패턴 (6자리 숫자)
+    stock_codes = _STOCK_CODE_RE.findall(query)
+    companies.extend(stock_codes)
+    
+    # 쿼리를 소문자로 변환하여 비교
+    query_lower = query.lower()
+    
+    # 정확한 매칭 먼저
+    if _COMPANY_AUTOMATON is not None:
+        # 쿼리를 한 번만 스캔 (등장 순서대로, 중복 제외)
+        matched = {}
+        for _, company in _COMPANY_AUTOMATON.iter(query_lower):
+            matched[company] = None
+        companies.extend(matched)
+    else:
+        matched = {}
+        for match_lower in _KNOWN_COMPANY_RE.findall(query_lower):
+            for company in _KNOWN_PREFIX_MATCHES[match_lower]:
+                matched[company] = None
+        companies.extend(matched)
+    
+    # 부분 매칭 추가 (쿼리의 일부가 회사명에 포함되는 경우)
+    # 예: "SK하이닉" -> "SK하이닉스"
+    if not companies:  # 정확한 매칭이 없을 때만
+        partial_matches = {}
+        words = query.split()
+        for word in words:
+            if len(word) >= 2:  # 2글자 이상인 단어만
+                for company in _KNOWN_SUBSTRING_INDEX.get(word.lower(), ()):
+                    if len(word) >= len(company) * 0.6:
+                        # 단어가 회사명의 60% 이상을 차지하면 매칭
+                        partial_matches[company] = None
+        companies.extend(partial_matches)
+    
+    # 기업명 패턴 (한글 2자 이상 + 선택적으로 영문/숫자)
+    for pattern in _COMPANY_PATTERN_RES:
+        companies.extend(pattern.findall(query))
+    
+    # 중복 제거 (등장 순서 유지) 및 반환
+    return tuple(dict.fromkeys(companies))
+
 
 class CorpCodeMapper:
     """기업 코드 매핑 관리"""
@@ -18,6 +187,9 @@ class CorpCodeMapper:
         """
         self.dart_reader = dart_reader
         self._cache = {}
+        # 기업 메타데이터는 거의 변하지 않으므로 조회 결과도 캐싱
+        self._info_cache: Dict[str, Dict[str, Any]] = {}
+        self._search_cache: Dict[Tuple[str, int], List[Dict[str, Any]]] = {}
         
     async def get_corp_code(self, company: str) -> Optional[str]:
         """
@@ -64,6 +236,10 @@ class CorpCodeMapper:
         Returns:
             기업 정보 딕셔너리
         """
+        # 캐시 확인
+        if company in self._info_cache:
+            return self._info_cache[company]
+        
         if not self.dart_reader:
             return None
             
@@ -71,7 +247,10 @@ class CorpCodeMapper:
             result = self.dart_reader.company(company)
             
             if result is not None and hasattr(result, 'to_dict'):
-                return result.to_dict('records')[0] if not result.empty else None
+                info = result.to_dict('records')[0] if not result.empty else None
+                if info is not None:
+                    self._info_cache[company] = info
+                return info
                 
         except Exception:
             pass
@@ -88,71 +267,7 @@ class CorpCodeMapper:
         Returns:
             기업명/종목코드 리스트
         """
-        companies = []
-        
-        # 종목코드 패턴 (6자리 숫자)
-        stock_codes = re.findall(r'\b\d{6}\b', query)
-        companies.extend(stock_codes)
-        
-        # 주요 기업명 패턴
-        # 알려진 대기업들 (확장 가능)
-        known_companies = [
-            "삼성전자", "SK하이닉스", "LG전자", "현대차", "현대자동차", "기아",
-            "네이버", "카카오", "쿠팡", "배달의민족", "우아한형제들",
-            "포스코", "POSCO", "현대제철", "롯데케미칼",
-            "삼성물산", "삼성생명", "삼성화재", "삼성증권", "삼성카드",
-            "LG화학", "LG디스플레이", "LG이노텍", "LG유플러스",
-            "SK텔레콤", "SKT", "SK이노베이션", "SK에너지",
-            "한국전력", "한전", "KT", "케이티",
-            "현대건설", "대우건설", "GS건설",
-            "신한은행", "국민은행", "우리은행", "하나은행", "기업은행",
-            "삼성바이오로직스", "셀트리온", "한미약품",
-            "대한항공", "아시아나항공", "제주항공",
-            "CJ제일제당", "CJ ENM", "CJ대한통운",
-            "아모레퍼시픽", "LG생활건강",
-            "현대모비스", "한국타이어", "현대위아",
-            "두산", "두산중공업", "두산인프라코어",
-            "한화", "한화솔루션", "한화에어로스페이스",
-            "엔씨소프트", "넥슨", "넷마블", "크래프톤", "펄어비스",
-            "현대중공업", "삼성중공업", "대우조선해양",
-            "SK바이오팜", "SK바이오사이언스",
-            "카카오뱅크", "카카오페이", "토스", "비바리퍼블리카"
-        ]
-        
-        # 쿼리를 소문자로 변환하여 비교
-        query_lower = query.lower()
-        
-        # 정확한 매칭 먼저
-        for company in known_companies:
-            if company.lower() in query_lower:
-                companies.append(company)
-        
-        # 부분 매칭 추가 (쿼리의 일부가 회사명에 포함되는 경우)
-        # 예: "SK하이닉" -> "SK하이닉스"
-        if not companies:  # 정확한 매칭이 없을 때만
-            words = query.split()
-            for word in words:
-                if len(word) >= 2:  # 2글자 이상인 단어만
-                    for company in known_companies:
-                        if word.lower() in company.lower() and len(word) >= len(company) * 0.6:
-                            # 단어가 회사명의 60% 이상을 차지하면 매칭
-                            if company not in companies:
-                                companies.append(company)
-        
-        # 기업명 패턴 (한글 2자 이상 + 선택적으로 영문/숫자)
-        # "OO전자", "OO화학" 등의 패턴
-        company_patterns = [
-            r'[가-힣]+(?:전자|화학|제약|바이오|엔터|건설|중공업|자동차|은행|증권|생명|화재|카드)',
-            r'[가-힣]+(?:케미칼|케미컬|에너지|모빌리티|솔루션)',
-            r'[가-힣]+(?:홀딩스|그룹|지주)',
-        ]
-        
-        for pattern in company_patterns:
-            matches = re.findall(pattern, query)
-            companies.extend(matches)
-        
-        # 중복 제거 및 반환
-        return list(set(companies))
+        return list(_extract_companies(query))
     
     async def validate_company(self, company: str) -> bool:
         """
@@ -177,7 +292,7 @@ class CorpCodeMapper:
         Returns:
             종목코드 형식 여부
         """
-        return bool(re.match(r'^\d{6}$', text))
+        return bool(_STOCK_CODE_FULL_RE.match(text))
     
     async def search_companies(self, keyword: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -190,6 +305,11 @@ class CorpCodeMapper:
         Returns:
             기업 정보 리스트
         """
+        # 캐시 확인
+        cache_key = (keyword, limit)
+        if cache_key in self._search_cache:
+            return self._search_cache[cache_key]
+        
         if not self.dart_reader:
             return []
             
@@ -197,8 +317,10 @@ class CorpCodeMapper:
             result = self.dart_reader.company_by_name(keyword)
             
             if result is not None and hasattr(result, 'to_dict'):
-                companies = result.to_dict('records')
-                return companies[:limit]
+                companies = result.to_dict('records')[:limit]
+                if companies:
+                    self._search_cache[cache_key] = companies
+                return companies
                 
         except Exception:
             pass
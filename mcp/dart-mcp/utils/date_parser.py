@@ -3,9 +3,115 @@
 사용자의 자연어 날짜 표현을 DART API 형식(YYYYMMDD)으로 변환
 """
 
-from datetime import datetime, timedelta
+import calendar
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Tuple, Optional
-import re
+
+# regex 모듈이 있으면 사용 (re와 호환되는 대체 엔진, 선택적)
+try:
+    import regex as re
+except ImportError:
+    import re
+
+
+# 날짜 패턴 (모듈 로드 시 1회 컴파일)
+_RECENT_YEARS_RE = re.compile(r"최근\s*(\d+)\s*년")
+_RECENT_MONTHS_RE = re.compile(r"최근\s*(\d+)\s*개월")
+_RECENT_WEEKS_RE = re.compile(r"최근\s*(\d+)\s*주")
+_RECENT_DAYS_RE = re.compile(r"최근\s*(\d+)\s*일")
+_THIS_YEAR_RE = re.compile(r"올해")
+_LAST_YEAR_RE = re.compile(r"작년")
+_YEAR_RE = re.compile(r"(\d{4})\s*년")
+_YEAR_MONTH_RE = re.compile(r"(\d{4})\s*년\s*(\d{1,2})\s*월")
+_SPECIFIC_DATE_RE = re.compile(r"(\d{4})[.-](\d{1,2})[.-](\d{1,2})")
+_QUARTER_YEAR_RE = re.compile(r"(\d{4})\s*년\s*(\d)\s*분기")
+_QUARTER_RE = re.compile(r"(\d)\s*분기")
+_RANGE_RE = re.compile(r"(\d{4}[.-]\d{1,2}[.-]\d{1,2})\s*[~-]\s*(\d{4}[.-]\d{1,2}[.-]\d{1,2})")
+
+
+# 날짜 패턴 핸들러: (매칭 결과, 오늘) -> (시작일, 종료일)
+def _handle_recent_years(m, today: datetime) -> Tuple[datetime, datetime]:
+    return today - timedelta(days=365 * int(m.group(1))), today
+
+
+def _handle_recent_months(m, today: datetime) -> Tuple[datetime, datetime]:
+    return today - timedelta(days=30 * int(m.group(1))), today
+
+
+def _handle_recent_weeks(m, today: datetime) -> Tuple[datetime, datetime]:
+    return today - timedelta(weeks=int(m.group(1))), today
+
+
+def _handle_recent_days(m, today: datetime) -> Tuple[datetime, datetime]:
+    return today - timedelta(days=int(m.group(1))), today
+
+
+def _handle_this_year(m, today: datetime) -> Tuple[datetime, datetime]:
+    return datetime(today.year, 1, 1), today
+
+
+def _handle_last_year(m, today: datetime) -> Tuple[datetime, datetime]:
+    return datetime(today.year - 1, 1, 1), datetime(today.year - 1, 12, 31)
+
+
+def _handle_year(m, today: datetime) -> Tuple[datetime, datetime]:
+    return datetime(int(m.group(1)), 1, 1), datetime(int(m.group(1)), 12, 31)
+
+
+def _handle_year_month(m, today: datetime) -> Tuple[datetime, datetime]:
+    return get_month_range(int(m.group(1)), int(m.group(2)))
+
+
+def _handle_specific_date(m, today: datetime) -> Tuple[datetime, datetime]:
+    return parse_specific_date(m.group(0))
+
+
+# 날짜 패턴 매칭 순서 (앞선 패턴이 우선)
+_DATE_PATTERNS = (
+    (_RECENT_YEARS_RE, _handle_recent_years),
+    (_RECENT_MONTHS_RE, _handle_recent_months),
+    (_RECENT_WEEKS_RE, _handle_recent_weeks),
+    (_RECENT_DAYS_RE, _handle_recent_days),
+    (_THIS_YEAR_RE, _handle_this_year),
+    (_LAST_YEAR_RE, _handle_last_year),
+    (_YEAR_RE, _handle_year),
+    (_YEAR_MONTH_RE, _handle_year_month),
+    (_SPECIFIC_DATE_RE, _handle_specific_date),
+)
+
+
+# 특별 키워드 핸들러: 오늘 -> (시작일, 종료일) 문자열
+def _handle_last_month(today: datetime) -> Tuple[str, str]:
+    last_month = today.replace(day=1) - timedelta(days=1)
+    start = last_month.replace(day=1)
+    return start.strftime("%Y%m%d"), last_month.strftime("%Y%m%d")
+
+
+def _handle_this_month(today: datetime) -> Tuple[str, str]:
+    start = today.replace(day=1)
+    return start.strftime("%Y%m%d"), today.strftime("%Y%m%d")
+
+
+def _handle_yesterday(today: datetime) -> Tuple[str, str]:
+    yesterday = today - timedelta(days=1)
+    return yesterday.strftime("%Y%m%d"), yesterday.strftime("%Y%m%d")
+
+
+def _handle_today(today: datetime) -> Tuple[str, str]:
+    return today.strftime("%Y%m%d"), today.strftime("%Y%m%d")
+
+
+# 특별 키워드 (앞선 그룹이 우선)
+_KEYWORD_HANDLERS = (
+    (frozenset(("지난달", "전월")), _handle_last_month),
+    (frozenset(("이번달", "당월")), _handle_this_month),
+    (frozenset(("어제",)), _handle_yesterday),
+    (frozenset(("오늘",)), _handle_today),
+)
+_KEYWORD_RE = re.compile("|".join(
+    keyword for keyword_group, _ in _KEYWORD_HANDLERS for keyword in sorted(keyword_group)
+))
 
 
 def parse_date_expression(expr: str) -> Tuple[str, str]:
@@ -18,56 +124,39 @@ def parse_date_expression(expr: str) -> Tuple[str, str]:
     Returns:
         (시작일, 종료일) 튜플 (YYYYMMDD 형식)
     """
-    today = datetime.now()
+    return _parse_date_expression_cached(expr, datetime.now().date())
+
+
+@lru_cache(maxsize=2048)
+def _parse_date_expression_cached(expr: str, today_date: date) -> Tuple[str, str]:
+    """
+    parse_date_expression 본체 (날짜 단위로 캐싱)
     
-    # 기본값: 최근 1개월
-    default_start = today - timedelta(days=30)
-    default_end = today
+    결과는 YYYYMMDD 문자열이므로 같은 날 같은 쿼리는 항상 같은 결과를 반환
+    """
+    today = datetime(today_date.year, today_date.month, today_date.day)
     
     # 날짜 패턴 매칭
-    patterns = {
-        r"최근\s*(\d+)\s*년": lambda m: (today - timedelta(days=365 * int(m.group(1))), today),
-        r"최근\s*(\d+)\s*개월": lambda m: (today - timedelta(days=30 * int(m.group(1))), today),
-        r"최근\s*(\d+)\s*주": lambda m: (today - timedelta(weeks=int(m.group(1))), today),
-        r"최근\s*(\d+)\s*일": lambda m: (today - timedelta(days=int(m.group(1))), today),
-        r"올해": lambda m: (datetime(today.year, 1, 1), today),
-        r"작년": lambda m: (datetime(today.year - 1, 1, 1), datetime(today.year - 1, 12, 31)),
-        r"(\d{4})\s*년": lambda m: (datetime(int(m.group(1)), 1, 1), datetime(int(m.group(1)), 12, 31)),
-        r"(\d{4})\s*년\s*(\d{1,2})\s*월": lambda m: get_month_range(int(m.group(1)), int(m.group(2))),
-        r"(\d{4})[.-](\d{1,2})[.-](\d{1,2})": lambda m: parse_specific_date(m.group(0)),
-    }
-    
-    for pattern, handler in patterns.items():
-        match = re.search(pattern, expr)
+    for pattern, handler in _DATE_PATTERNS:
+        match = pattern.search(expr)
         if match:
             try:
-                start, end = handler(match)
+                start, end = handler(match, today)
                 return start.strftime("%Y%m%d"), end.strftime("%Y%m%d")
             except:
                 continue
     
-    # 특별 키워드 처리
-    if "지난달" in expr or "전월" in expr:
-        last_month = today.replace(day=1) - timedelta(days=1)
-        start = last_month.replace(day=1)
-        end = last_month
-        return start.strftime("%Y%m%d"), end.strftime("%Y%m%d")
-    
-    if "이번달" in expr or "당월" in expr:
-        start = today.replace(day=1)
-        return start.strftime("%Y%m%d"), today.strftime("%Y%m%d")
-    
-    if "어제" in expr:
-        yesterday = today - timedelta(days=1)
-        return yesterday.strftime("%Y%m%d"), yesterday.strftime("%Y%m%d")
-    
-    if "오늘" in expr:
-        return today.strftime("%Y%m%d"), today.strftime("%Y%m%d")
+    # 특별 키워드 처리 (한 번의 스캔으로 모든 키워드를 찾고 우선순위대로 처리)
+    keywords = set(_KEYWORD_RE.findall(expr))
+    if keywords:
+        for keyword_group, handler in _KEYWORD_HANDLERS:
+            if not keywords.isdisjoint(keyword_group):
+                return handler(today)
     
     # 분기 처리
-    quarter_match = re.search(r"(\d{4})\s*년\s*(\d)\s*분기", expr)
+    quarter_match = _QUARTER_YEAR_RE.search(expr)
     if not quarter_match:
-        quarter_match = re.search(r"(\d)\s*분기", expr)
+        quarter_match = _QUARTER_RE.search(expr)
         if quarter_match:
             year = today.year
             quarter = int(quarter_match.group(1))
@@ -82,41 +171,32 @@ def parse_date_expression(expr: str) -> Tuple[str, str]:
         start, end = get_quarter_range(year if year else today.year, quarter)
         return start.strftime("%Y%m%d"), end.strftime("%Y%m%d")
     
-    # 기본값 반환
-    return default_start.strftime("%Y%m%d"), default_end.strftime("%Y%m%d")
+    # 기본값 반환: 최근 1개월
+    default_start = today - timedelta(days=30)
+    return default_start.strftime("%Y%m%d"), today.strftime("%Y%m%d")
 
 
 def get_month_range(year: int, month: int) -> Tuple[datetime, datetime]:
     """특정 년월의 시작일과 종료일 반환"""
-    start = datetime(year, month, 1)
-    if month == 12:
-        end = datetime(year, 12, 31)
-    else:
-        end = datetime(year, month + 1, 1) - timedelta(days=1)
-    return start, end
+    return datetime(year, month, 1), datetime(year, month, calendar.monthrange(year, month)[1])
+
+
+# 분기 -> (시작 월, 종료 월, 종료 일)
+_QUARTER_BOUNDS = {
+    1: (1, 3, 31),
+    2: (4, 6, 30),
+    3: (7, 9, 30),
+    4: (10, 12, 31)
+}
 
 
 def get_quarter_range(year: int, quarter: int) -> Tuple[datetime, datetime]:
     """특정 분기의 시작일과 종료일 반환"""
-    quarter_months = {
-        1: (1, 3),
-        2: (4, 6),
-        3: (7, 9),
-        4: (10, 12)
-    }
-    
-    if quarter not in quarter_months:
+    if quarter not in _QUARTER_BOUNDS:
         raise ValueError(f"Invalid quarter: {quarter}")
     
-    start_month, end_month = quarter_months[quarter]
-    start = datetime(year, start_month, 1)
-    
-    if end_month == 12:
-        end = datetime(year, 12, 31)
-    else:
-        end = datetime(year, end_month + 1, 1) - timedelta(days=1)
-    
-    return start, end
+    start_month, end_month, end_day = _QUARTER_BOUNDS[quarter]
+    return datetime(year, start_month, 1), datetime(year, end_month, end_day)
 
 
 def parse_specific_date(date_str: str) -> Tuple[datetime, datetime]:
@@ -140,9 +220,14 @@ def extract_date_range_from_query(query: str) -> Optional[Tuple[str, str]]:
     Returns:
         (시작일, 종료일) 또는 None
     """
+    return _extract_date_range_cached(query, datetime.now().date())
+
+
+@lru_cache(maxsize=2048)
+def _extract_date_range_cached(query: str, today_date: date) -> Optional[Tuple[str, str]]:
+    """extract_date_range_from_query 본체 (날짜 단위로 캐싱)"""
     # 명시적 날짜 범위 패턴
-    range_pattern = r"(\d{4}[.-]\d{1,2}[.-]\d{1,2})\s*[~-]\s*(\d{4}[.-]\d{1,2}[.-]\d{1,2})"
-    match = re.search(range_pattern, query)
+    match = _RANGE_RE.search(query)
     
     if match:
         try:
@@ -157,4 +242,4 @@ def extract_date_range_from_query(query: str) -> Optional[Tuple[str, str]]:
             pass
     
     # 일반 날짜 표현 파싱
-    return parse_date_expression(query)
\ No newline at end of file
+    return _parse_date_expression_cached(query, today_date)
@@ -3,20 +3,74 @@ DART 원본 문서 다운로더
 공시서류 원본파일 API를 통해 실제 문서를 다운로드하고 텍스트 추출
 """
 
+import io
 import os
 import zipfile
 import asyncio
+import importlib.util
 import httpx
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple, Union
 import xml.etree.ElementTree as ET
-from bs4 import BeautifulSoup
+from lxml import html as lxml_html
 import json
 
 from utils.logging import get_logger
 
 logger = get_logger("document_downloader")
 
+# 원본파일 다운로드 청크 크기 및 ZIP 시그니처
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# 이 크기 이하의 ZIP은 디스크에 저장하지 않고 메모리에서 압축 해제
+_IN_MEMORY_ZIP_LIMIT = 1024 * 1024
+_ZIP_MAGIC = b"PK\x03\x04"
+
+# HTTP/2는 h2 패키지가 설치된 경우에만 사용 (httpx[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# 모든 다운로더 인스턴스가 공유하는 HTTP 클라이언트 (이벤트 루프별로 1개)
+_shared_client: Optional[httpx.AsyncClient] = None
+_shared_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """
+    공유 HTTP 클라이언트 반환 (없으면 생성)
+    
+    여러 rcept_no 다운로드가 커넥션/TLS 세션을 재사용하도록 모듈 단위로 공유.
+    httpx 커넥션은 이벤트 루프에 묶이므로 루프가 바뀌면 새로 생성
+    """
+    global _shared_client, _shared_client_loop
+    
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client.is_closed or _shared_client_loop is not loop:
+        _shared_client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            timeout=60.0,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32)
+        )
+        _shared_client_loop = loop
+    
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """공유 HTTP 클라이언트 종료"""
+    global _shared_client, _shared_client_loop
+    
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+        _shared_client_loop = None
+
+
+# 압축 해제 디렉토리에 저장하는 텍스트 추출 결과 파일명
+_EXTRACTED_FILENAME = "_extracted.json"
+
+# 원본 HTML은 UTF-8로 가정 (기존 open(..., encoding='utf-8')과 동일)
+_HTML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+
 
 class DartDocumentDownloader:
     """DART 원본 문서 다운로드 및 텍스트 추출"""
@@ -34,6 +88,26 @@ class DartDocumentDownloader:
         # DART 원본파일 다운로드 API
         self.document_url = "https://opendart.fss.or.kr/api/document.xml"
         
+    
+    async def download_many(self, rcept_nos: List[str], concurrency: int = 8) -> List[Dict[str, Any]]:
+        """
+        여러 원본 문서를 동시에 다운로드 (동시 요청 수 제한)
+        
+        Args:
+            rcept_nos: 접수번호 리스트
+            concurrency: 최대 동시 다운로드 수
+            
+        Returns:
+            rcept_nos 순서와 동일한 문서 내용 딕셔너리 리스트
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _download_one(rcept_no: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.download_document(rcept_no)
+        
+        return await asyncio.gather(*[_download_one(rcept_no) for rcept_no in rcept_nos])
+        
     async def download_document(self, rcept_no: str) -> Dict[str, Any]:
         """
         원본 문서 다운로드 및 텍스트 추출
@@ -54,7 +128,14 @@ class DartDocumentDownloader:
             # 이미 다운로드된 경우 캐시 사용
             if extract_dir.exists():
                 logger.info(f"Using cached document: {extract_dir}")
-                return await self._extract_text_from_files(extract_dir)
+                cached_result = self._load_extracted(extract_dir)
+                if cached_result is not None:
+                    return cached_result
+                
+                # 추출 결과가 없으면 (이전 실행이 중간에 끊긴 경우 등) 다시 파싱
+                result = await self._extract_text_from_files(extract_dir)
+                self._save_extracted(extract_dir, result)
+                return result
             
             # API 파라미터
             params = {
@@ -62,14 +143,13 @@ class DartDocumentDownloader:
                 "rcept_no": rcept_no
             }
             
-            # 파일 다운로드
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.get(
-                    self.document_url,
-                    params=params,
-                    follow_redirects=True
-                )
-                
+            # 파일 다운로드 (응답 전체를 메모리에 올리지 않고 청크 단위로 디스크에 기록)
+            async with _get_shared_client().stream(
+                "GET",
+                self.document_url,
+                params=params,
+                follow_redirects=True
+            ) as response:
                 if response.status_code != 200:
                     logger.error(f"Download failed: {response.status_code}")
                     return {
@@ -77,12 +157,15 @@ class DartDocumentDownloader:
                         "rcept_no": rcept_no
                     }
                 
-                # Content-Type 확인
-                content_type = response.headers.get("content-type", "")
+                chunks = response.aiter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE)
+                try:
+                    first_chunk = await chunks.__anext__()
+                except StopAsyncIteration:
+                    first_chunk = b""
                 
-                # 에러 응답 확인 (XML 형식의 에러)
-                if "xml" in content_type or "text" in content_type:
-                    content = response.text
+                # 에러 응답 확인 (ZIP 대신 XML 형식의 에러가 오는 경우)
+                if not first_chunk.startswith(_ZIP_MAGIC):
+                    content = first_chunk.decode("utf-8", errors="replace")
                     if "err_code" in content or "err_msg" in content:
                         logger.error(f"API error: {content}")
                         return {
@@ -90,16 +173,29 @@ class DartDocumentDownloader:
                             "rcept_no": rcept_no
                         }
                 
-                # ZIP 파일 저장
-                with open(zip_path, "wb") as f:
-                    f.write(response.content)
+                content_length = int(response.headers.get("content-length") or 0)
                 
-                logger.info(f"Downloaded {len(response.content)} bytes to {zip_path}")
+                if 0 < content_length <= _IN_MEMORY_ZIP_LIMIT:
+                    # 작은 파일은 디스크에 쓰지 않고 메모리에서 바로 압축 해제
+                    body = bytearray(first_chunk)
+                    async for chunk in chunks:
+                        body += chunk
+                    zip_source = io.BytesIO(body)
+                    logger.info(f"Downloaded {len(body)} bytes (in memory)")
+                else:
+                    # ZIP 파일 저장 (디스크 쓰기는 스레드 풀에서 수행해 이벤트 루프를 막지 않음)
+                    with open(zip_path, "wb") as f:
+                        await asyncio.to_thread(f.write, first_chunk)
+                        downloaded = len(first_chunk)
+                        async for chunk in chunks:
+                            await asyncio.to_thread(f.write, chunk)
+                            downloaded += len(chunk)
+                    zip_source = zip_path
+                    logger.info(f"Downloaded {downloaded} bytes to {zip_path}")
             
             # ZIP 파일 압축 해제
             try:
-                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                    zip_ref.extractall(extract_dir)
+                await asyncio.to_thread(self._extract_zip, zip_source, extract_dir)
                 logger.info(f"Extracted to {extract_dir}")
             except zipfile.BadZipFile:
                 logger.error(f"Invalid ZIP file: {zip_path}")
@@ -110,6 +206,7 @@ class DartDocumentDownloader:
             
             # 텍스트 추출
             result = await self._extract_text_from_files(extract_dir)
+            self._save_extracted(extract_dir, result)
             
             # ZIP 파일 삭제 (공간 절약)
             if zip_path.exists():
@@ -144,34 +241,26 @@ class DartDocumentDownloader:
         
         all_text = []
         
-        # 디렉토리 내 파일 탐색
-        for file_path in extract_dir.glob("**/*"):
-            if file_path.is_file():
-                file_info = {
-                    "name": file_path.name,
-                    "path": str(file_path.relative_to(extract_dir)),
-                    "size": file_path.stat().st_size
-                }
-                result["files"].append(file_info)
-                
-                # XML 파일 처리
-                if file_path.suffix.lower() == '.xml':
-                    text = self._extract_text_from_xml(file_path)
-                    if text:
-                        all_text.append(f"=== {file_path.name} ===\n{text}")
-                        
-                        # 메인 문서 확인
-                        if any(keyword in file_path.name.lower() for keyword in ['main', 'body', '본문']):
-                            result["main_text"] = text[:10000]
-                
-                # HTML 파일 처리
-                elif file_path.suffix.lower() in ['.html', '.htm']:
-                    text = self._extract_text_from_html(file_path)
-                    if text:
-                        all_text.append(f"=== {file_path.name} ===\n{text}")
-                        
-                        if not result["main_text"]:
-                            result["main_text"] = text[:10000]
+        # 디렉토리 내 파일 탐색 후 파일별 파싱을 스레드 풀에서 병렬 수행
+        file_entries = await asyncio.to_thread(self._list_files, extract_dir)
+        parsed_files = await asyncio.gather(*[
+            asyncio.to_thread(self._parse_file, file_path, file_size, extract_dir)
+            for file_path, file_size in file_entries
+        ])
+        
+        # 파일 순서대로 결과 병합
+        for file_info, text, is_main in parsed_files:
+            result["files"].append(file_info)
+            
+            if not text:
+                continue
+            
+            all_text.append(f"=== {file_info['name']} ===\n{text}")
+            
+            if is_main:
+                result["main_text"] = text[:10000]
+            elif not result["main_text"] and file_info["name"].lower().endswith(('.html', '.htm')):
+                result["main_text"] = text[:10000]
         
         # 전체 텍스트 결합 (최대 20000자)
         result["content"] = "\n\n".join(all_text)[:20000]
@@ -184,48 +273,166 @@ class DartDocumentDownloader:
         
         return result
     
-    def _extract_text_from_xml(self, file_path: Path) -> str:
-        """XML 파일에서 텍스트 추출"""
+    @staticmethod
+    def _load_extracted(extract_dir: Path) -> Optional[Dict[str, Any]]:
+        """저장된 텍스트 추출 결과 로드 (없거나 손상된 경우 None)"""
+        extracted_path = extract_dir / _EXTRACTED_FILENAME
+        if not extracted_path.exists():
+            return None
+        
+        try:
+            with open(extracted_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to load extracted result {extracted_path}: {e}")
+            return None
+    
+    @staticmethod
+    def _save_extracted(extract_dir: Path, result: Dict[str, Any]) -> None:
+        """텍스트 추출 결과 저장 (재요청 시 파일 재파싱 생략)"""
+        extracted_path = extract_dir / _EXTRACTED_FILENAME
+        try:
+            with open(extracted_path, 'w', encoding='utf-8') as f:
+                json.dump(result, f, ensure_ascii=False)
+        except Exception as e:
+            logger.warning(f"Failed to save extracted result {extracted_path}: {e}")
+    
+    @staticmethod
+    def _extract_zip(zip_source: Union[Path, io.BytesIO], extract_dir: Path) -> None:
+        """ZIP 파일 압축 해제 (스레드 풀에서 실행)"""
+        with zipfile.ZipFile(zip_source, 'r') as zip_ref:
+            zip_ref.extractall(extract_dir)
+    
+    @staticmethod
+    def _list_files(extract_dir: Path) -> List[Tuple[Path, int]]:
+        """
+        압축 해제 디렉토리의 파일 목록 수집 (하위 디렉토리 포함)
+        
+        os.scandir의 DirEntry를 사용해 파일/디렉토리 판별에 추가 stat 호출을 하지 않음.
+        디렉토리마다 파일을 먼저 나열한 뒤 하위 디렉토리로 내려감
+        
+        Returns:
+            (파일 경로, 파일 크기) 리스트
+        """
+        files = []
+        pending_dirs = [str(extract_dir)]
+        
+        while pending_dirs:
+            subdirs = []
+            with os.scandir(pending_dirs.pop(0)) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False) and entry.name != _EXTRACTED_FILENAME:
+                        files.append((Path(entry.path), entry.stat().st_size))
+            pending_dirs[0:0] = subdirs
+        
+        return files
+    
+    def _parse_file(
+        self,
+        file_path: Path,
+        file_size: int,
+        extract_dir: Path
+    ) -> Tuple[Dict[str, Any], str, bool]:
+        """
+        단일 파일 파싱 (스레드 풀에서 실행)
+        
+        Args:
+            file_path: 파일 경로
+            file_size: 파일 크기
+            extract_dir: 압축 해제 디렉토리
+            
+        Returns:
+            (파일 정보, 추출된 텍스트, 메인 문서 여부) 튜플
+        """
+        file_info = {
+            "name": file_path.name,
+            "path": str(file_path.relative_to(extract_dir)),
+            "size": file_size
+        }
+        
+        suffix = file_path.suffix.lower()
+        
+        # XML 파일 처리
+        if suffix == '.xml':
+            text = self._extract_text_from_xml(file_path)
+            # 메인 문서 확인
+            is_main = any(keyword in file_path.name.lower() for keyword in ['main', 'body', '본문'])
+            return file_info, text, is_main
+        
+        # HTML 파일 처리
+        if suffix in ['.html', '.htm']:
+            return file_info, self._extract_text_from_html(file_path), False
+        
+        return file_info, "", False
+    
+    def _extract_text_from_xml(self, file_path: Path, max_elements: int = 500) -> str:
+        """
+        XML 파일에서 텍스트 추출
+        
+        iterparse로 스트리밍 파싱하며 텍스트 요소가 max_elements개 모이면 중단.
+        end 이벤트는 자식 요소가 먼저 나오므로 start 순서를 기록해 문서 순서를 유지
+        """
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
+            texts = []  # (문서 순서, 텍스트)
+            open_elements = []  # 아직 닫히지 않은 (문서 순서, 요소)
+            order = 0
             
-            # 모든 텍스트 노드 수집
-            texts = []
-            for elem in root.iter():
-                if elem.text and elem.text.strip():
-                    # 태그명과 함께 저장 (중요 정보 식별용)
-                    tag_name = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
-                    texts.append(f"[{tag_name}]: {elem.text.strip()}")
+            with open(file_path, 'rb') as f:
+                for event, elem in ET.iterparse(f, events=("start", "end")):
+                    if event == "start":
+                        open_elements.append((order, elem))
+                        order += 1
+                        continue
+                    
+                    elem_order, _ = open_elements.pop()
+                    if elem.text and elem.text.strip():
+                        texts.append((elem_order, self._format_xml_text(elem)))
+                    elem.clear()
+                    
+                    if len(texts) >= max_elements:
+                        # 열려 있는 상위 요소의 텍스트는 첫 자식 이전에 이미 확정됨
+                        for parent_order, parent in open_elements:
+                            if parent.text and parent.text.strip():
+                                texts.append((parent_order, self._format_xml_text(parent)))
+                        break
             
-            return "\n".join(texts[:500])  # 최대 500개 요소
+            # 모든 텍스트 노드를 문서 순서로 정렬
+            texts.sort(key=lambda item: item[0])
+            return "\n".join(text for _, text in texts[:max_elements])  # 최대 500개 요소
             
         except Exception as e:
             logger.error(f"Failed to parse XML {file_path}: {e}")
             return ""
     
+    @staticmethod
+    def _format_xml_text(elem) -> str:
+        """태그명과 함께 텍스트 포맷 (중요 정보 식별용)"""
+        tag_name = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
+        return f"[{tag_name}]: {elem.text.strip()}"
+    
     def _extract_text_from_html(self, file_path: Path) -> str:
         """HTML 파일에서 텍스트 추출"""
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            with open(file_path, 'rb') as f:
                 content = f.read()
             
-            soup = BeautifulSoup(content, 'html.parser')
+            tree = lxml_html.fromstring(content, parser=_HTML_PARSER)
             
-            # 스크립트와 스타일 제거
-            for script in soup(["script", "style"]):
-                script.decompose()
+            # 스크립트와 스타일 제거 (뒤따르는 텍스트는 유지)
+            for element in tree.xpath("//script|//style"):
+                element.drop_tree()
             
             # 테이블 추출 (중요 정보)
-            tables = soup.find_all('table')
             table_texts = []
-            for table in tables[:5]:  # 최대 5개 테이블
+            for table in tree.xpath("//table")[:5]:  # 최대 5개 테이블
                 table_text = self._extract_table_text(table)
                 if table_text:
                     table_texts.append(table_text)
             
             # 본문 텍스트 추출
-            text = soup.get_text()
+            text = tree.text_content()
             lines = [line.strip() for line in text.splitlines() if line.strip()]
             main_text = "\n".join(lines[:500])  # 최대 500줄
             
@@ -243,10 +450,10 @@ class DartDocumentDownloader:
         """HTML 테이블에서 텍스트 추출"""
         try:
             rows = []
-            for tr in table.find_all('tr')[:20]:  # 최대 20행
+            for tr in table.xpath(".//tr")[:20]:  # 최대 20행
                 cells = []
-                for td in tr.find_all(['td', 'th'])[:10]:  # 최대 10열
-                    cells.append(td.get_text(strip=True))
+                for td in tr.xpath(".//td|.//th")[:10]:  # 최대 10열
+                    cells.append(td.text_content().strip())
                 if cells:
                     rows.append(" | ".join(cells))
             
@@ -7,42 +7,162 @@ import os
 import re
 import json
 import asyncio
-from typing import Dict, Any, List, Optional, Union
+import importlib.util
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple, Union
 from pathlib import Path
 from datetime import datetime
 import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 from utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
 logger = get_logger("document_extractor")
 
+# PDF/HTML 파싱 라이브러리는 설치 여부만 확인하고, 실제 import는 해당 추출 경로에서 수행
+# (XBRL만 처리하는 프로세스는 pdfminer/bs4 import 비용을 치르지 않음)
+
 # PDF 파싱 라이브러리 (선택적)
-try:
+PDF_SUPPORT = importlib.util.find_spec("pdfplumber") is not None
+if not PDF_SUPPORT:
+    logger.warning("pdfplumber not installed, PDF extraction disabled")
+
+# PyMuPDF (선택적) - 테이블이 필요 없을 때 쓰는 빠른 텍스트 추출 경로
+PYMUPDF_SUPPORT = importlib.util.find_spec("pymupdf") is not None
+
+# PDF 페이지 추출 (pdfminer 기반으로 CPU 부하가 커서 페이지별로 프로세스 풀에서 처리)
+_PDF_MAX_PAGES = 10
+_PDF_WORKERS = min(os.cpu_count() or 1, 4)
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """PDF 페이지 추출용 프로세스 풀 (최초 사용 시 생성)"""
+    global _pdf_pool
+    if _pdf_pool is None:
+        _pdf_pool = ProcessPoolExecutor(max_workers=_PDF_WORKERS)
+    return _pdf_pool
+
+
+def _reset_pdf_pool() -> None:
+    """워커가 비정상 종료된 풀은 버리고 다음 요청에서 새로 만든다"""
+    global _pdf_pool
+    if _pdf_pool is not None:
+        _pdf_pool.shutdown(wait=False)
+        _pdf_pool = None
+
+
+def _process_pdf_page(path: str, page_idx: int) -> Tuple[str, List]:
+    """PDF 한 페이지의 텍스트와 테이블 추출 (워커 프로세스에서 실행)"""
     import pdfplumber
-    PDF_SUPPORT = True
+    
+    with pdfplumber.open(path) as pdf:
+        page = pdf.pages[page_idx]
+        return page.extract_text() or "", page.extract_tables() or []
+
+
+# Aho-Corasick (선택적) - 주요 키워드를 텍스트 1회 스캔으로 매칭
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
 except ImportError:
-    PDF_SUPPORT = False
-    logger.warning("pdfplumber not installed, PDF extraction disabled")
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
 
 # HTML 파싱
+HTML_SUPPORT = importlib.util.find_spec("bs4") is not None
+if not HTML_SUPPORT:
+    logger.warning("BeautifulSoup not installed, HTML parsing limited")
+
+# selectolax (선택적) - BeautifulSoup이 없을 때 정규식 대신 쓰는 C 기반 HTML 파서
 try:
-    from bs4 import BeautifulSoup
-    HTML_SUPPORT = True
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_SUPPORT = True
 except ImportError:
-    HTML_SUPPORT = False
-    logger.warning("BeautifulSoup not installed, HTML parsing limited")
+    SELECTOLAX_SUPPORT = False
+
+# BeautifulSoup 파서 (lxml이 있으면 C 기반 파서 사용)
+try:
+    from lxml import html as lxml_html
+    HTML_PARSER = "lxml"
+    _LXML_HTML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+except ImportError:
+    HTML_PARSER = "html.parser"
+    _LXML_HTML_PARSER = None
+
+# 구조 추출에 실제로 읽는 태그만 트리로 만든다
+_HTML_STRUCTURE_TAGS = ["title", "table", "a"]
+
+# 핵심 정보 추출 패턴
+_AMOUNT_RE = re.compile(r'(\d{1,3}(?:,\d{3})*(?:\.\d+)?)\s*(?:억원|백만원|천만원|만원|원|달러|USD)')
+_DATE_RE = re.compile(r'\d{4}[-년.]\s*\d{1,2}[-월.]\s*\d{1,2}일?')
+_PERCENT_RE = re.compile(r'(\d+(?:\.\d+)?)\s*[%％]')
+
+# 항목별 최대 추출 개수
+_KEY_INFO_LIMIT = 10
+
+
+def _uniq_take(pattern: re.Pattern, text: str, limit: int = _KEY_INFO_LIMIT) -> List[str]:
+    """
+    pattern과 일치하는 값을 등장 순서대로 중복 없이 최대 limit개 반환
+    
+    그룹이 있는 패턴은 findall과 같이 첫 번째 그룹 값을 사용하며,
+    limit개를 모으면 스캔을 멈춘다.
+    """
+    values = {}  # 삽입 순서를 유지하는 중복 제거 (dict.fromkeys와 같은 방식)
+    group = 1 if pattern.groups else 0
+    for match in pattern.finditer(text):
+        value = match.group(group)
+        if value not in values:
+            values[value] = None
+            if len(values) >= limit:
+                break
+    return list(values)
+
+
+# 주요 키워드 - 텍스트 1회 스캔으로 모두 찾는다
+_KEYWORDS = (
+    "유상증자", "무상증자", "자사주", "자기주식", "합병", "분할",
+    "매출", "영업이익", "당기순이익", "배당", "감자", "상장",
+    "계약", "투자", "인수", "매각", "청산", "파산"
+)
+
+
+def _build_keyword_automaton():
+    """주요 키워드로 Aho-Corasick 오토마톤 생성"""
+    automaton = ahocorasick.Automaton()
+    for keyword in _KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton() if AHOCORASICK_AVAILABLE else None
+# 오토마톤이 없을 때의 대체 패턴 (전방탐색으로 겹치는 키워드도 모두 잡음)
+_KEYWORD_RE = re.compile("(?=(" + "|".join(map(re.escape, _KEYWORDS)) + "))")
+
+# 정규식 기반 HTML 텍스트 추출 패턴
+_SCRIPT_RE = re.compile(r'<script[^>]*>.*?</script>', re.DOTALL)
+_STYLE_RE = re.compile(r'<style[^>]*>.*?</style>', re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
 
 
 class DocumentExtractor:
     """DART 문서 정보 추출기"""
     
-    def __init__(self, download_dir: str = "./downloads/dart"):
+    def __init__(self, download_dir: str = "./downloads/dart", pdf_tables: bool = True):
         """
         Args:
             download_dir: 다운로드 디렉토리
+            pdf_tables: PDF 테이블 추출 여부 (False면 PyMuPDF로 텍스트만 빠르게 추출)
         """
         self.download_dir = Path(download_dir)
         self.download_dir.mkdir(parents=True, exist_ok=True)
+        self.pdf_tables = pdf_tables
         
     async def extract_from_document(
         self,
@@ -87,6 +207,9 @@ class DocumentExtractor:
     
     async def _extract_from_pdf(self, file_path: Path) -> Dict[str, Any]:
         """PDF 문서에서 정보 추출"""
+        if PYMUPDF_SUPPORT and (not self.pdf_tables or not PDF_SUPPORT):
+            return await asyncio.to_thread(self._extract_text_pymupdf, file_path)
+        
         if not PDF_SUPPORT:
             return {"error": "PDF 지원이 설치되지 않았습니다"}
         
@@ -100,44 +223,97 @@ class DocumentExtractor:
         }
         
         try:
+            import pdfplumber
+            
             with pdfplumber.open(file_path) as pdf:
                 # 메타데이터
                 extracted_data["metadata"] = pdf.metadata or {}
                 extracted_data["page_count"] = len(pdf.pages)
+            
+            # 페이지별 텍스트/테이블 추출 (최대 10페이지, 병렬)
+            loop = asyncio.get_running_loop()
+            pool = _get_pdf_pool()
+            page_results = await asyncio.gather(*(
+                loop.run_in_executor(pool, _process_pdf_page, str(file_path), i)
+                for i in range(min(extracted_data["page_count"], _PDF_MAX_PAGES))
+            ))
+            
+            all_text = []
+            
+            for i, (page_text, tables) in enumerate(page_results):
+                page_data = {
+                    "page_num": i + 1,
+                    "text": page_text,
+                    "tables": []
+                }
                 
-                all_text = []
+                # 텍스트 추출
+                if page_data["text"]:
+                    all_text.append(page_data["text"])
                 
-                for i, page in enumerate(pdf.pages[:10]):  # 최대 10페이지
-                    page_data = {
-                        "page_num": i + 1,
-                        "text": page.extract_text() or "",
-                        "tables": []
-                    }
-                    
-                    # 텍스트 추출
-                    if page_data["text"]:
-                        all_text.append(page_data["text"])
-                    
-                    # 테이블 추출
-                    tables = page.extract_tables()
-                    if tables:
-                        for table in tables:
-                            if table and len(table) > 1:  # 유효한 테이블
-                                page_data["tables"].append(self._process_table(table))
-                                extracted_data["tables"].append({
-                                    "page": i + 1,
-                                    "data": table[:5]  # 첫 5행만
-                                })
-                    
-                    extracted_data["pages"].append(page_data)
+                # 테이블 추출
+                for table in tables:
+                    if table and len(table) > 1:  # 유효한 테이블
+                        page_data["tables"].append(self._process_table(table))
+                        extracted_data["tables"].append({
+                            "page": i + 1,
+                            "data": table[:5]  # 첫 5행만
+                        })
                 
-                extracted_data["text"] = "\n\n".join(all_text)
+                extracted_data["pages"].append(page_data)
+            
+            extracted_data["text"] = "\n\n".join(all_text)
+            
+            # 핵심 정보 추출
+            extracted_data["key_info"] = self._extract_key_info_from_text(
+                extracted_data["text"]
+            )
+            
+        except Exception as e:
+            if isinstance(e, BrokenProcessPool):
+                _reset_pdf_pool()
+            logger.error(f"PDF extraction error: {e}")
+            extracted_data["error"] = str(e)
+        
+        return extracted_data
+    
+    def _extract_text_pymupdf(self, file_path: Path) -> Dict[str, Any]:
+        """PyMuPDF로 PDF 텍스트만 추출 (테이블 없음, 반환 형식은 동일)"""
+        extracted_data = {
+            "type": "pdf",
+            "file": file_path.name,
+            "pages": [],
+            "tables": [],
+            "text": "",
+            "metadata": {}
+        }
+        
+        try:
+            import pymupdf
+            
+            with pymupdf.open(file_path) as doc:
+                extracted_data["metadata"] = doc.metadata or {}
+                extracted_data["page_count"] = doc.page_count
                 
-                # 핵심 정보 추출
-                extracted_data["key_info"] = self._extract_key_info_from_text(
-                    extracted_data["text"]
-                )
+                all_text = []
                 
+                for i in range(min(doc.page_count, _PDF_MAX_PAGES)):
+                    page_text = doc[i].get_text() or ""
+                    if page_text:
+                        all_text.append(page_text)
+                    extracted_data["pages"].append({
+                        "page_num": i + 1,
+                        "text": page_text,
+                        "tables": []
+                    })
+            
+            extracted_data["text"] = "\n\n".join(all_text)
+            
+            # 핵심 정보 추출
+            extracted_data["key_info"] = self._extract_key_info_from_text(
+                extracted_data["text"]
+            )
+            
         except Exception as e:
             logger.error(f"PDF extraction error: {e}")
             extracted_data["error"] = str(e)
@@ -155,29 +331,28 @@ class DocumentExtractor:
         }
         
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-            
-            # 네임스페이스 추출
-            namespaces = dict([
-                node for _, node in ET.iterparse(file_path, events=['start-ns'])
-            ])
+            # 파싱 1회로 트리와 네임스페이스를 함께 얻는다
+            namespaces = {}
+            parser = ET.iterparse(file_path, events=('start-ns',))
+            for _, (prefix, uri) in parser:
+                namespaces[prefix] = uri
+            root = parser.root
             extracted_data["namespaces"] = namespaces
             
+            # 텍스트 내용과 XBRL 재무 수치를 트리 1회 순회로 수집
+            is_xbrl = 'xbrl' in str(root.tag).lower()
+            all_text, facts = self._collect_text_and_facts(root, collect_facts=is_xbrl)
+            
             # XBRL 재무 데이터 추출
-            if 'xbrli' in str(root.tag).lower() or 'xbrl' in str(root.tag).lower():
-                extracted_data["financial_data"] = self._extract_xbrl_data(root, namespaces)
+            if is_xbrl:
+                extracted_data["financial_data"] = self._extract_xbrl_data(
+                    root, namespaces, facts
+                )
             
             # 일반 XML 데이터 추출
             extracted_data["elements"] = self._xml_to_dict(root)
             
-            # 텍스트 내용 추출
-            all_text = []
-            for elem in root.iter():
-                if elem.text and elem.text.strip():
-                    all_text.append(elem.text.strip())
-            
-            extracted_data["text"] = " ".join(all_text[:1000])  # 첫 1000개 텍스트
+            extracted_data["text"] = " ".join(all_text)  # 첫 1000개 텍스트
             
         except Exception as e:
             logger.error(f"XML extraction error: {e}")
@@ -197,11 +372,22 @@ class DocumentExtractor:
         }
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # 파일 읽기는 스레드에서 (이벤트 루프 블로킹 방지)
+            content = await asyncio.to_thread(file_path.read_text, encoding='utf-8')
             
             if HTML_SUPPORT:
-                soup = BeautifulSoup(content, 'html.parser')
+                from bs4 import BeautifulSoup, SoupStrainer
+                
+                if _LXML_HTML_PARSER is not None:
+                    # 구조용 트리는 필요한 태그만, 본문은 lxml.html로 별도 추출
+                    soup = BeautifulSoup(
+                        content, HTML_PARSER,
+                        parse_only=SoupStrainer(_HTML_STRUCTURE_TAGS)
+                    )
+                    full_soup = None
+                else:
+                    # html.parser는 느리므로 전체 트리 하나를 구조/본문에 같이 사용
+                    soup = full_soup = BeautifulSoup(content, HTML_PARSER)
                 
                 # 제목 추출
                 title = soup.find('title')
@@ -216,9 +402,7 @@ class DocumentExtractor:
                         extracted_data["tables"].append(table_data)
                 
                 # 텍스트 추출
-                for script in soup(["script", "style"]):
-                    script.decompose()
-                text = soup.get_text()
+                text = self._html_to_text(content, full_soup)
                 lines = [line.strip() for line in text.splitlines() if line.strip()]
                 extracted_data["text"] = "\n".join(lines[:500])  # 첫 500줄
                 
@@ -253,8 +437,7 @@ class DocumentExtractor:
         }
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                text = f.read()
+            text = await asyncio.to_thread(file_path.read_text, encoding='utf-8')
             
             extracted_data["text"] = text[:10000]  # 최대 10000자
             extracted_data["key_info"] = self._extract_key_info_from_text(text)
@@ -276,28 +459,20 @@ class DocumentExtractor:
         }
         
         # 금액 추출 (억원, 백만원 등)
-        amount_pattern = r'(\d{1,3}(?:,\d{3})*(?:\.\d+)?)\s*(?:억원|백만원|천만원|만원|원|달러|USD)'
-        amounts = re.findall(amount_pattern, text)
-        key_info["amounts"] = list(set(amounts[:10]))
+        key_info["amounts"] = _uniq_take(_AMOUNT_RE, text)
         
         # 날짜 추출
-        date_pattern = r'\d{4}[-년.]\s*\d{1,2}[-월.]\s*\d{1,2}일?'
-        dates = re.findall(date_pattern, text)
-        key_info["dates"] = list(set(dates[:10]))
+        key_info["dates"] = _uniq_take(_DATE_RE, text)
         
         # 퍼센트 추출
-        percent_pattern = r'(\d+(?:\.\d+)?)\s*[%％]'
-        percentages = re.findall(percent_pattern, text)
-        key_info["percentages"] = list(set(percentages[:10]))
+        key_info["percentages"] = _uniq_take(_PERCENT_RE, text)
         
         # 주요 키워드
-        keywords = [
-            "유상증자", "무상증자", "자사주", "자기주식", "합병", "분할",
-            "매출", "영업이익", "당기순이익", "배당", "감자", "상장",
-            "계약", "투자", "인수", "매각", "청산", "파산"
-        ]
-        found_keywords = [kw for kw in keywords if kw in text]
-        key_info["keywords"] = found_keywords
+        if _KEYWORD_AUTOMATON is not None:
+            found = {keyword for _, keyword in _KEYWORD_AUTOMATON.iter(text)}
+        else:
+            found = set(_KEYWORD_RE.findall(text))
+        key_info["keywords"] = [kw for kw in _KEYWORDS if kw in found]
         
         return key_info
     
@@ -326,75 +501,133 @@ class DocumentExtractor:
         
         return processed
     
-    def _extract_xbrl_data(self, root: ET.Element, namespaces: Dict) -> Dict[str, Any]:
-        """XBRL 재무 데이터 추출"""
+    def _collect_text_and_facts(
+        self,
+        root: ET.Element,
+        collect_facts: bool,
+        max_texts: int = 1000,
+        max_facts: int = 100
+    ) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """
+        트리를 한 번 순회하며 텍스트와 XBRL 재무 수치를 수집
+        
+        두 목록이 모두 상한에 도달하면 순회를 멈춘다.
+        """
+        all_text = []
+        facts = []
+        facts_done = not collect_facts
+        
+        for elem in root.iter():
+            text = elem.text.strip() if elem.text else ""
+            if not text:
+                continue
+            
+            if len(all_text) < max_texts:
+                all_text.append(text)
+            
+            if not facts_done and '}' in elem.tag:
+                facts.append({
+                    "name": elem.tag.split('}')[1],
+                    "value": text,
+                    "context": elem.get('contextRef'),
+                    "unit": elem.get('unitRef'),
+                    "decimals": elem.get('decimals')
+                })
+                facts_done = len(facts) >= max_facts
+            
+            if facts_done and len(all_text) >= max_texts:
+                break
+        
+        return all_text, facts
+    
+    def _extract_xbrl_data(
+        self,
+        root: ET.Element,
+        namespaces: Dict,
+        facts: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """XBRL 재무 데이터 추출 (재무 수치는 _collect_text_and_facts에서 수집)"""
         financial_data = {
             "contexts": {},
             "units": {},
-            "facts": []
+            "facts": facts
         }
         
         try:
-            # Context 정보 추출
-            for context in root.findall('.//xbrli:context', namespaces):
+            # Context 정보 추출 (XBRL 인스턴스에서 context는 루트의 직계 자식,
+            # period는 context의 직계 자식이므로 전체 트리를 탐색하지 않음)
+            for context in root.iterfind('xbrli:context', namespaces):
                 context_id = context.get('id')
-                period = context.find('.//xbrli:period', namespaces)
+                period = context.find('xbrli:period', namespaces)
                 if period is not None:
                     instant = period.find('xbrli:instant', namespaces)
                     if instant is not None:
                         financial_data["contexts"][context_id] = instant.text
             
-            # 재무 수치 추출
-            for elem in root.iter():
-                if '}' in elem.tag:
-                    tag_name = elem.tag.split('}')[1]
-                    if elem.text and elem.text.strip():
-                        fact = {
-                            "name": tag_name,
-                            "value": elem.text.strip(),
-                            "context": elem.get('contextRef'),
-                            "unit": elem.get('unitRef'),
-                            "decimals": elem.get('decimals')
-                        }
-                        financial_data["facts"].append(fact)
-                        
-                        if len(financial_data["facts"]) >= 100:  # 최대 100개
-                            break
-            
         except Exception as e:
             logger.error(f"XBRL extraction error: {e}")
         
         return financial_data
     
-    def _xml_to_dict(self, element: ET.Element) -> Dict[str, Any]:
-        """XML 요소를 딕셔너리로 변환"""
-        result = {}
+    @staticmethod
+    def _xml_node(element: ET.Element) -> Dict[str, Any]:
+        """요소 자신의 속성과 텍스트만 담은 딕셔너리"""
+        node = {}
         
         # 속성 추가
         if element.attrib:
-            result["@attributes"] = element.attrib
+            node["@attributes"] = element.attrib
         
         # 텍스트 내용
-        if element.text and element.text.strip():
-            result["text"] = element.text.strip()
-        
-        # 자식 요소
-        children = {}
-        for child in element:
-            child_data = self._xml_to_dict(child)
-            tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-            
-            if tag in children:
-                if not isinstance(children[tag], list):
-                    children[tag] = [children[tag]]
-                children[tag].append(child_data)
-            else:
-                children[tag] = child_data
+        text = element.text
+        if text:
+            text = text.strip()
+            if text:
+                node["text"] = text
+        
+        return node
+    
+    def _xml_to_dict(self, element: ET.Element) -> Dict[str, Any]:
+        """
+        XML 요소를 딕셔너리로 변환
         
-        if children:
-            result.update(children)
+        재귀 대신 명시적 스택으로 순회한다. 자식 딕셔너리는 부모에 먼저 연결한 뒤
+        스택에서 꺼낼 때 채우므로 결과 구조와 키 순서는 재귀 버전과 같다.
+        """
+        xml_node = self._xml_node
+        result = xml_node(element)
+        if not result and not len(element):
+            return None
+        
+        stack = [(element, result)]
+        while stack:
+            elem, out = stack.pop()
+            
+            # 자식 요소
+            children = {}
+            for child in elem:
+                child_data = xml_node(child)
+                if len(child):
+                    stack.append((child, child_data))
+                elif not child_data:
+                    child_data = None
+                
+                tag = child.tag
+                tag = tag[tag.rfind('}') + 1:]
+                
+                if tag in children:
+                    existing = children[tag]
+                    if isinstance(existing, list):
+                        existing.append(child_data)
+                    else:
+                        children[tag] = [existing, child_data]
+                else:
+                    children[tag] = child_data
+            
+            if children:
+                out.update(children)
         
-        return result if result else None
+        return result
     
     def _extract_html_table(self, table) -> Optional[Dict[str, Any]]:
         """HTML 테이블 추출"""
@@ -430,13 +663,45 @@ class DocumentExtractor:
         
         return None
     
+    def _html_to_text(self, content: str, soup: Optional["BeautifulSoup"] = None) -> str:
+        """
+        HTML 본문 텍스트 추출 (script/style 제외)
+        
+        soup이 주어지면 다시 파싱하지 않고 그 트리에서 script/style을 제거해 사용한다.
+        """
+        if soup is None and _LXML_HTML_PARSER is not None:
+            try:
+                root = lxml_html.document_fromstring(
+                    content.encode("utf-8"), parser=_LXML_HTML_PARSER
+                )
+            except Exception:
+                root = None
+            if root is not None:
+                for elem in root.xpath("//script | //style"):
+                    elem.drop_tree()
+                return root.text_content()
+        
+        if soup is None:
+            from bs4 import BeautifulSoup
+            
+            soup = BeautifulSoup(content, HTML_PARSER)
+        for tag in soup.find_all(["script", "style"]):
+            tag.decompose()
+        return soup.get_text()
+    
     def _extract_text_from_html_regex(self, html: str) -> str:
-        """정규식으로 HTML에서 텍스트 추출"""
+        """정규식으로 HTML에서 텍스트 추출 (selectolax가 있으면 파서 사용)"""
+        if SELECTOLAX_SUPPORT:
+            tree = LexborHTMLParser(html)
+            for node in tree.css('script, style'):
+                node.decompose()
+            return _WS_RE.sub(' ', tree.text(separator=' ')).strip()[:5000]
+        
         # HTML 태그 제거
-        text = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL)
-        text = re.sub(r'<style[^>]*>.*?</style>', '', text, flags=re.DOTALL)
-        text = re.sub(r'<[^>]+>', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
+        text = _SCRIPT_RE.sub('', html)
+        text = _STYLE_RE.sub('', text)
+        text = _TAG_RE.sub(' ', text)
+        text = _WS_RE.sub(' ', text)
         return text.strip()[:5000]  # 최대 5000자
 
 
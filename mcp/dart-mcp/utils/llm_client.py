@@ -4,16 +4,15 @@ LLM 클라이언트 설정 유틸리티
 """
 
 import os
-from typing import Optional, Dict, Any, Tuple
+import importlib.util
+from typing import Optional, Dict, Any, Tuple, TYPE_CHECKING
 from dotenv import load_dotenv
-from openai import OpenAI
 
-# 조건부 import
-try:
-    import langextract as lx
-    LANGEXTRACT_AVAILABLE = True
-except ImportError:
-    LANGEXTRACT_AVAILABLE = False
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+# 조건부 import (설치 여부만 확인, 실제 import는 사용 시점에)
+LANGEXTRACT_AVAILABLE = importlib.util.find_spec("langextract") is not None
 
 
 class LLMClientConfig:
@@ -29,6 +28,8 @@ class LLMClientConfig:
         
         self.use_extraction_llm = use_extraction_llm
         self.config = self._load_config()
+        # OpenAI 클라이언트 (최초 요청 시 생성 후 재사용 - 연결 풀 유지)
+        self._client: Optional[OpenAI] = None
         
     def _load_config(self) -> Dict[str, Any]:
         """환경변수에서 설정 로드"""
@@ -123,9 +124,21 @@ class LLMClientConfig:
         
         return config
     
-    def get_openai_client(self) -> Optional[OpenAI]:
-        """OpenAI 호환 클라이언트 반환"""
+    def get_openai_client(self) -> Optional["OpenAI"]:
+        """OpenAI 호환 클라이언트 반환 (인스턴스당 1회 생성)"""
+        if self._client is None:
+            self._client = self._create_openai_client()
+        return self._client
+    
+    def _create_openai_client(self) -> Optional["OpenAI"]:
+        """설정 모드에 맞는 OpenAI 호환 클라이언트 생성"""
         mode = self.config.get('mode')
+        if mode not in ('openai', 'vllm', 'ollama'):
+            return None
+        
+        # openai 패키지는 클라이언트가 실제로 필요할 때만 import
+        from openai import OpenAI
+        
         
         if mode == 'openai':
             return OpenAI(api_key=self.config.get('api_key'))
@@ -252,6 +265,8 @@ def create_langextract_example(
     if not LANGEXTRACT_AVAILABLE:
         return None
     
+    import langextract as lx
+    
     extraction_objects = []
     for ext in extractions:
         extraction_objects.append(
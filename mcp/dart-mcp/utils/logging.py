@@ -6,6 +6,24 @@ import logging
 import json
 from datetime import datetime
 from pathlib import Path
+from typing import Dict, Tuple
+
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Shared formatter for every dart-mcp console handler
+_FORMATTER = logging.Formatter(
+    "%(asctime)s.%(msecs)03d %(levelname)7s %(name)s : %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+# Loggers already returned by get_logger, keyed by (name, level)
+_LOGGER_CACHE: Dict[Tuple[str, str], logging.Logger] = {}
 
 def get_logger(name: str = "dart-mcp", level: str = "INFO") -> logging.Logger:
     """
@@ -18,22 +36,24 @@ def get_logger(name: str = "dart-mcp", level: str = "INFO") -> logging.Logger:
     Returns:
         Configured logger instance
     """
+    key = (name, level)
+    cached = _LOGGER_CACHE.get(key)
+    if cached is not None:
+        return cached
+    
     logger = logging.getLogger(name)
     
     # Only configure if not already configured
     if not logger.handlers:
-        logger.setLevel(getattr(logging, level.upper(), logging.INFO))
+        logger.setLevel(_LEVELS.get(level.upper(), logging.INFO))
         
         # Console handler with simple text formatting (matching kc-chat-api style)
         console_handler = logging.StreamHandler()
-        formatter = logging.Formatter(
-            "%(asctime)s.%(msecs)03d %(levelname)7s %(name)s : %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(_FORMATTER)
         logger.addHandler(console_handler)
         
         # Prevent propagation to root logger
         logger.propagate = False
     
+    _LOGGER_CACHE[key] = logger
     return logger
\ No newline at end of file
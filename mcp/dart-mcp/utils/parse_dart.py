@@ -3,17 +3,226 @@ DART document parsing utilities
 """
 
 import asyncio
+import importlib.util
 import json
 import re
 from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
-from collections import defaultdict
+from functools import lru_cache
+from collections import Counter, OrderedDict
 import httpx
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer, FeatureNotFound
 from .logging import get_logger
 
+# Aho-Corasick (선택적) - 회사명 접미사를 텍스트 1회 스캔으로 찾음
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
+# orjson (선택적) - 결과 JSON 직렬화 가속
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 logger = get_logger("dart-mcp.parse")
 
+# HTML 파서 (lxml이 없으면 html.parser로 대체)
+_HTML_PARSER = "lxml"
+# 본문 추출(_extract_dart_document_content)에 쓰이는 태그만 트리로 생성
+_STRAINER = SoupStrainer([
+    'meta', 'title', 'table', 'div', 'p', 'span',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'tr', 'td', 'th', 'tbody', 'thead'
+])
+
+# 회사명 접미사
+_COMPANY_SUFFIXES = (
+    "전자", "화학", "물산", "건설", "제약", "바이오", "테크", "엔터", "미디어", "금융",
+    "증권", "은행", "보험", "카드", "캐피탈", "자산운용", "투자", "그룹", "홀딩스"
+)
+_CORP_PREFIX = "주식회사"
+
+# 엔티티 추출 패턴 (회사명/인명은 그룹 1만 캡처)
+_COMPANY_RE = re.compile(
+    r'(?:주식회사\s*)?([가-힣]+(?:' + '|'.join(_COMPANY_SUFFIXES) + r'))'
+)
+# 날짜/금액/퍼센트는 서로 겹치지 않으므로 하나의 패턴으로 1회 스캔
+# 캡처 그룹은 값으로 쓰는 부분에만 둔다 (그룹이 없는 매치 = 날짜 전체)
+_NUMERIC_ENTITY_RE = re.compile(r"""
+      \d{4} (?: 년\s*\d{1,2}월\s*\d{1,2}일 | \.\d{1,2}\.\d{1,2} | -\d{1,2}-\d{1,2} )
+    | (?P<amount> \d{1,3} (?:,\d{3})* (?:\.\d+)? ) \s* (?:원|억원|백만원|천원|달러|USD|KRW)
+    | (?P<percent> \d+ (?:\.\d+)? ) \s* [%％]
+""", re.VERBOSE)
+_NUMERIC_ENTITY_KEYS = {None: 'dates', 'amount': 'amounts', 'percent': 'percentages'}
+_ENTITY_KEYS = ('companies', 'dates', 'amounts', 'percentages', 'people', 'products')
+_PERSON_RE = re.compile(r'(?:대표이사|이사|감사|사장|부사장|전무|상무|이사회\s*의장)\s*([가-힣]{2,4})')
+
+# 요청 헤더
+_REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
+}
+# HTTP/2는 h2 패키지가 설치된 경우에만 사용 (httpx[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+# 여러 URL 동시 파싱 시 최대 동시 요청 수
+_MULTI_URL_CONCURRENCY = 10
+# 페이지 응답 최대 크기 및 스트리밍 청크 크기
+_MAX_RESPONSE_BYTES = 32 * 1024 * 1024
+_RESPONSE_CHUNK_SIZE = 64 * 1024
+# 파싱한 페이지 본문 캐시 크기 (URL 기준 LRU, 추출한 텍스트만 보관)
+_PAGE_CACHE_SIZE = 128
+# 고급 분석용으로 잠시 보관하는 원문 HTML의 총 크기 상한 (bytes)
+_HTML_CACHE_BYTES = 32 * 1024 * 1024
+
+# DART 컨텐츠 컨테이너 (앞쪽일수록 우선)
+_CONTENT_SELECTORS = (
+    'div.contents',
+    'div#content',
+    'div.report_content',
+    'div.view_cont',
+    'div.view_content',
+    'div.doc_content',
+    'div.document',
+)
+_CONTENT_SELECTOR_CSS = tuple(soupsieve.compile(selector) for selector in _CONTENT_SELECTORS)
+# 모든 컨테이너 후보를 한 번의 탐색으로 찾기 위한 그룹 셀렉터
+_CONTENT_CSS = soupsieve.compile(', '.join(_CONTENT_SELECTORS))
+
+# DART 특화 메타데이터 셀렉터 (항목별로 앞쪽 셀렉터 우선)
+_META_SELECTORS = {
+    key: tuple(soupsieve.compile(selector) for selector in selectors)
+    for key, selectors in {
+        '공시일자': ('span.date', 'div.rcept_dt'),
+        '회사명': ('span.corp_name', 'div.corp_name'),
+        '보고서명': ('span.report_nm', 'div.report_nm'),
+        '제출인': ('span.flr_nm', 'div.flr_nm'),
+    }.items()
+}
+
+# 섹션 분리 기준 헤딩 태그와 섹션 내용으로 수집하는 태그
+_HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+_SECTION_CONTENT_TAGS = frozenset(('p', 'div', 'span', 'table', 'ul', 'ol'))
+
+# 본문 텍스트로 추출하는 태그
+_TEXT_TAGS = frozenset(('p', 'div', 'span', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'))
+
+# 재무제표 키워드
+_FINANCIAL_KEYWORDS = ('자산', '부채', '자본', '매출', '영업이익', '당기순이익')
+# 재무 지표 셀 값의 숫자 추출
+_NUMBER_RE = re.compile(r'[\d,]+')
+
+
+def _build_suffix_automaton():
+    """회사명 접미사로 Aho-Corasick 오토마톤 생성"""
+    automaton = ahocorasick.Automaton()
+    for suffix in _COMPANY_SUFFIXES:
+        automaton.add_word(suffix, len(suffix))
+    automaton.make_automaton()
+    return automaton
+
+
+_SUFFIX_AUTOMATON = _build_suffix_automaton() if AHOCORASICK_AVAILABLE else None
+
+
+def _is_hangul(char: str) -> bool:
+    return '\uac00' <= char <= '\ud7a3'
+
+
+def _find_companies(text: str) -> set:
+    """
+    회사명 추출 (_COMPANY_RE.findall과 같은 결과의 집합)
+    
+    접미사 위치를 오토마톤으로 찾은 뒤 앞쪽 한글 구간을 거슬러 올라가 회사명을 만든다.
+    정규식과 같이 한글 구간마다 가장 뒤에 끝나는 접미사까지를 회사명으로 보고,
+    구간이 '주식회사'로 시작하면 그 뒤부터를 회사명으로 본다
+    (단, 바로 앞에 '주식회사' + 공백이 있으면 구간 전체가 회사명).
+    """
+    if _SUFFIX_AUTOMATON is None:
+        return set(_COMPANY_RE.findall(text))
+    
+    prefix_len = len(_CORP_PREFIX)
+    # 한글 구간 시작 위치 -> [접미사 끝(전체), 접미사 끝('주식회사' 이후)]
+    runs: Dict[int, List[int]] = {}
+    run_start = -1
+    checked_until = -1  # text[run_start:checked_until]는 모두 한글임이 확인됨
+    
+    for end, suffix_len in _SUFFIX_AUTOMATON.iter(text):
+        suffix_start = end - suffix_len + 1
+        # 접미사 앞에 한글이 최소 1자 있어야 함
+        if suffix_start == 0 or not _is_hangul(text[suffix_start - 1]):
+            continue
+        
+        # 접미사가 속한 한글 구간의 시작 위치 (이전에 확인한 구간은 다시 보지 않음)
+        pos = suffix_start - 1
+        while pos >= checked_until and pos > 0 and _is_hangul(text[pos - 1]):
+            pos -= 1
+        if pos >= checked_until or run_start < 0:
+            run_start = pos
+        checked_until = end + 1
+        
+        ends = runs.setdefault(run_start, [-1, -1])
+        ends[0] = end + 1
+        if suffix_start > run_start + prefix_len:
+            ends[1] = end + 1
+    
+    companies = set()
+    for start, (full_end, after_prefix_end) in runs.items():
+        if (
+            after_prefix_end > 0
+            and text.startswith(_CORP_PREFIX, start)
+            and not _follows_corp_prefix(text, start)
+        ):
+            companies.add(text[start + prefix_len:after_prefix_end])
+        else:
+            companies.add(text[start:full_end])
+    return companies
+
+
+def _follows_corp_prefix(text: str, start: int) -> bool:
+    """
+    start 앞이 '주식회사' + 공백인지 여부
+    
+    이 경우 정규식은 앞의 '주식회사'를 접두어로 소비하므로 현재 구간은 처음부터 회사명이 된다.
+    """
+    pos = start - 1
+    while pos >= 0 and text[pos].isspace():
+        pos -= 1
+    return pos < start - 1 and text.endswith(_CORP_PREFIX, 0, pos + 1)
+
+
+def _dumps(obj: Any) -> str:
+    """결과 JSON 직렬화 (orjson이 있으면 사용, 한글은 이스케이프하지 않음)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def _make_soup(
+    markup: bytes,
+    parse_only: Optional[SoupStrainer] = None,
+    from_encoding: Optional[str] = None
+) -> BeautifulSoup:
+    """
+    HTML 파싱 (lxml 사용, 설치되지 않은 경우 html.parser로 대체)
+    
+    원문 bytes를 그대로 넘기며, from_encoding이 없으면 BOM/meta charset으로 인코딩을 판별한다.
+    """
+    global _HTML_PARSER
+    try:
+        return BeautifulSoup(markup, _HTML_PARSER, parse_only=parse_only, from_encoding=from_encoding)
+    except FeatureNotFound:
+        logger.warning("lxml을 찾을 수 없어 html.parser로 대체합니다")
+        _HTML_PARSER = "html.parser"
+        return BeautifulSoup(markup, _HTML_PARSER, parse_only=parse_only, from_encoding=from_encoding)
+
 
 def _extract_metadata(soup: BeautifulSoup) -> Dict[str, str]:
     """HTML에서 메타데이터 추출"""
@@ -27,16 +236,9 @@ def _extract_metadata(soup: BeautifulSoup) -> Dict[str, str]:
             metadata[name] = content
     
     # DART 특화 메타데이터
-    meta_selectors = {
-        '공시일자': ['span.date', 'div.rcept_dt'],
-        '회사명': ['span.corp_name', 'div.corp_name'],
-        '보고서명': ['span.report_nm', 'div.report_nm'],
-        '제출인': ['span.flr_nm', 'div.flr_nm']
-    }
-    
-    for key, selectors in meta_selectors.items():
-        for selector in selectors:
-            elem = soup.select_one(selector)
+    for key, selectors in _META_SELECTORS.items():
+        for css in selectors:
+            elem = css.select_one(soup)
             if elem:
                 metadata[key] = elem.get_text(strip=True)
                 break
@@ -44,107 +246,103 @@ def _extract_metadata(soup: BeautifulSoup) -> Dict[str, str]:
     return metadata
 
 
-def _extract_financial_data(soup: BeautifulSoup) -> Dict[str, Any]:
-    """재무 데이터 추출"""
+def _collect_tables(soup: BeautifulSoup) -> List[Tuple[Any, str]]:
+    """문서의 테이블과 각 테이블의 텍스트 (여러 추출 함수에서 공유)"""
+    return [(table, table.get_text()) for table in soup.find_all('table')]
+
+
+def _extract_financial_data(tables: List[Tuple[Any, str]]) -> Dict[str, Any]:
+    """재무 데이터 추출 (tables: _collect_tables 결과)"""
     financial_data = {
         'statements': [],
         'key_metrics': {},
         'currency': 'KRW'
     }
     
-    # 재무제표 테이블 찾기
-    financial_keywords = ['자산', '부채', '자본', '매출', '영업이익', '당기순이익']
-    tables = soup.find_all('table')
-    
-    for table in tables:
-        table_text = table.get_text()
-        if any(keyword in table_text for keyword in financial_keywords):
-            # 테이블 파싱
-            headers = []
-            rows = []
-            
-            for tr in table.find_all('tr'):
-                cells = tr.find_all(['th', 'td'])
-                if not headers and cells:
-                    headers = [cell.get_text(strip=True) for cell in cells]
-                elif cells:
-                    row_data = [cell.get_text(strip=True) for cell in cells]
-                    rows.append(dict(zip(headers, row_data)))
-            
-            if rows:
-                financial_data['statements'].append({
-                    'headers': headers,
-                    'data': rows
-                })
-    
-    # 주요 지표 추출
-    for keyword in financial_keywords:
-        for table in tables:
-            cells = table.find_all(['td', 'th'])
-            for i, cell in enumerate(cells):
-                if keyword in cell.get_text():
-                    # 다음 셀에서 값 추출
-                    if i + 1 < len(cells):
-                        value_text = cells[i + 1].get_text(strip=True)
-                        # 숫자 추출
-                        numbers = re.findall(r'[\d,]+', value_text)
-                        if numbers:
-                            financial_data['key_metrics'][keyword] = numbers[0]
+    key_metrics = {}
+    for table, table_text in tables:
+        # 재무제표 테이블 찾기
+        if not any(keyword in table_text for keyword in _FINANCIAL_KEYWORDS):
+            continue
+        
+        # 셀 텍스트는 셀마다 한 번만 계산하여 테이블 파싱과 지표 추출에 함께 사용
+        cells = table.find_all(['td', 'th'])
+        texts = [cell.get_text(strip=True) for cell in cells]
+        text_by_cell = {id(cell): text for cell, text in zip(cells, texts)}
+        
+        # 테이블 파싱
+        headers = []
+        rows = []
+        for tr in table.find_all('tr'):
+            row_texts = [text_by_cell[id(cell)] for cell in tr.find_all(['th', 'td'])]
+            if not headers and row_texts:
+                headers = row_texts
+            elif row_texts:
+                rows.append(dict(zip(headers, row_texts)))
+        
+        if rows:
+            financial_data['statements'].append({
+                'headers': headers,
+                'data': rows
+            })
+        
+        # 주요 지표 추출 (키워드가 있는 셀의 다음 셀 값, 키워드별로 마지막 값 사용)
+        for i in range(len(texts) - 1):
+            matched = [keyword for keyword in _FINANCIAL_KEYWORDS if keyword in texts[i]]
+            if not matched:
+                continue
+            numbers = _NUMBER_RE.findall(texts[i + 1])
+            if numbers:
+                for keyword in matched:
+                    key_metrics[keyword] = numbers[0]
+    
+    # 키워드 순서 유지
+    financial_data['key_metrics'] = {
+        keyword: key_metrics[keyword] for keyword in _FINANCIAL_KEYWORDS if keyword in key_metrics
+    }
     
     return financial_data
 
 
 def _extract_key_entities(text: str) -> Dict[str, List[str]]:
     """텍스트에서 주요 엔티티 추출"""
-    entities = {
-        'companies': [],
-        'dates': [],
-        'amounts': [],
-        'percentages': [],
-        'people': [],
-        'products': []
-    }
+    # 빈 텍스트는 정규식 스캔 없이 바로 반환
+    if not text:
+        return {key: [] for key in _ENTITY_KEYS}
+    return {key: list(values) for key, values in _extract_key_entities_cached(text)}
+
+
+@lru_cache(maxsize=128)
+def _extract_key_entities_cached(text: str) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    """
+    _extract_key_entities 본체 (텍스트 단위로 캐싱)
+    
+    같은 문서를 반복 분석하면 정규식 스캔을 건너뜀. 캐시된 값이 변경되지 않도록 튜플로 반환
+    """
+    entities = dict.fromkeys(_ENTITY_KEYS, ())
     
     # 회사명 패턴
-    company_pattern = r'(?:주식회사\s*)?([가-힣]+(?:전자|화학|물산|건설|제약|바이오|테크|엔터|미디어|금융|증권|은행|보험|카드|캐피탈|자산운용|투자|그룹|홀딩스))'
-    companies = re.findall(company_pattern, text)
-    entities['companies'] = list(set(companies))
-    
-    # 날짜 패턴
-    date_patterns = [
-        r'\d{4}년\s*\d{1,2}월\s*\d{1,2}일',
-        r'\d{4}\.\d{1,2}\.\d{1,2}',
-        r'\d{4}-\d{1,2}-\d{1,2}'
-    ]
-    for pattern in date_patterns:
-        dates = re.findall(pattern, text)
-        entities['dates'].extend(dates)
-    entities['dates'] = list(set(entities['dates']))
-    
-    # 금액 패턴
-    amount_pattern = r'(\d{1,3}(?:,\d{3})*(?:\.\d+)?)\s*(?:원|억원|백만원|천원|달러|USD|KRW)'
-    amounts = re.findall(amount_pattern, text)
-    entities['amounts'] = list(set(amounts))
-    
-    # 퍼센트 패턴
-    percent_pattern = r'(\d+(?:\.\d+)?)\s*[%％]'
-    percentages = re.findall(percent_pattern, text)
-    entities['percentages'] = list(set(percentages))
+    entities['companies'] = tuple(_find_companies(text))
+    
+    # 날짜/금액/퍼센트 패턴 (1회 스캔 후 그룹 이름으로 분류)
+    found = {key: set() for key in _NUMERIC_ENTITY_KEYS.values()}
+    for match in _NUMERIC_ENTITY_RE.finditer(text):
+        group = match.lastgroup
+        found[_NUMERIC_ENTITY_KEYS[group]].add(match.group(group or 0))
+    for key, values in found.items():
+        entities[key] = tuple(values)
     
     # 인명 패턴 (대표이사, 이사 등)
-    person_pattern = r'(?:대표이사|이사|감사|사장|부사장|전무|상무|이사회\s*의장)\s*([가-힣]{2,4})'
-    people = re.findall(person_pattern, text)
-    entities['people'] = list(set(people))
+    entities['people'] = tuple({*_PERSON_RE.findall(text)})
     
-    return entities
+    return tuple(entities.items())
 
 
-def _extract_tables_advanced(soup: BeautifulSoup) -> List[Dict[str, Any]]:
-    """고급 테이블 추출 및 분석"""
+def _extract_tables_advanced(tables: List[Tuple[Any, str]]) -> List[Dict[str, Any]]:
+    """고급 테이블 추출 및 분석 (tables: _collect_tables 결과)"""
     tables_data = []
     
-    tables = soup.find_all('table')
-    for idx, table in enumerate(tables):
+    for idx, (table, table_text) in enumerate(tables):
         table_info = {
             'index': idx,
             'headers': [],
@@ -175,7 +373,6 @@ def _extract_tables_advanced(soup: BeautifulSoup) -> List[Dict[str, Any]]:
                 table_info['rows'].append(row_data)
         
         # 테이블 타입 추론
-        table_text = table.get_text()
         if any(keyword in table_text for keyword in ['자산', '부채', '자본']):
             table_info['type'] = 'financial_position'
         elif any(keyword in table_text for keyword in ['매출', '영업이익', '당기순이익']):
@@ -199,148 +396,241 @@ def _extract_sections(soup: BeautifulSoup) -> Dict[str, str]:
     sections = {}
     
     # 헤딩 태그 기반 섹션 분리
-    headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+    headings = soup.find_all(_HEADING_TAGS)
     
+    # 헤딩의 부모마다 자식 목록을 한 번만 훑어, 각 헤딩부터 다음 형제 헤딩까지의 컨텐츠를 수집
+    contents_by_heading: Dict[int, List[str]] = {}
+    visited_parents = set()
     for heading in headings:
-        section_title = heading.get_text(strip=True)
-        section_content = []
-        
-        # 다음 헤딩까지의 컨텐츠 수집
-        current = heading.find_next_sibling()
-        while current and current.name not in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-            if current.name in ['p', 'div', 'span', 'table', 'ul', 'ol']:
-                text = current.get_text(strip=True)
+        parent = heading.parent
+        if id(parent) in visited_parents:
+            continue
+        visited_parents.add(id(parent))
+        
+        section_content = None
+        for child in parent.children:
+            name = child.name
+            if name in _HEADING_TAGS:
+                section_content = contents_by_heading[id(child)] = []
+            elif section_content is not None and name in _SECTION_CONTENT_TAGS:
+                text = child.get_text(strip=True)
                 if text:
                     section_content.append(text)
-            current = current.find_next_sibling()
-        
+    
+    # 같은 제목의 섹션은 문서 순서상 뒤의 것이 남음
+    for heading in headings:
+        section_content = contents_by_heading[id(heading)]
         if section_content:
-            sections[section_title] = '\n'.join(section_content)
+            sections[heading.get_text(strip=True)] = '\n'.join(section_content)
     
     return sections
 
 
+def _content_priority(elem) -> int:
+    """컨텐츠 컨테이너 셀렉터 중 elem이 일치하는 가장 앞쪽 순번"""
+    for priority, css in enumerate(_CONTENT_SELECTOR_CSS):
+        if css.match(elem):
+            return priority
+    return len(_CONTENT_SELECTOR_CSS)
+
+
+def _iter_text_elements(root):
+    """
+    root 하위의 텍스트 태그(_TEXT_TAGS)를 문서 순서로 반환 (테이블 하위 트리 제외)
+    
+    find_all 후 요소마다 find_parent('table')로 조상을 거슬러 올라가는 대신
+    트리를 한 번만 순회하면서 테이블을 만나면 그 하위를 건너뛴다.
+    """
+    # root 자체가 테이블 안에 있으면 모든 요소가 테이블 내부
+    if root.find_parent('table'):
+        return
+    
+    stack = list(reversed(root.contents))
+    while stack:
+        node = stack.pop()
+        name = node.name
+        # 텍스트 노드(name이 None)와 테이블 하위 트리는 건너뜀
+        if name is None or name == 'table':
+            continue
+        if name in _TEXT_TAGS:
+            yield node
+        stack.extend(reversed(node.contents))
+
+
 def _extract_dart_document_content(soup: BeautifulSoup, url: str) -> str:
     """
     DART 문서의 내용을 구조화하여 추출합니다.
     """
+    # 중복 제거 및 정리 (추가 시점에 바로 확인)
+    seen = set()
     content_parts = []
     
+    def emit(part: str) -> None:
+        if part not in seen and part.strip():
+            seen.add(part)
+            content_parts.append(part)
+    
     # 추가 메타데이터 추출
     metadata = _extract_metadata(soup)
     if metadata:
-        content_parts.append("[메타데이터]")
+        emit("[메타데이터]")
         for key, value in metadata.items():
-            content_parts.append(f"{key}: {value}")
-        content_parts.append("-" * 50)
+            emit(f"{key}: {value}")
+        emit("-" * 50)
     
     # 제목 추출
     title_elem = soup.find('title')
     if title_elem:
-        content_parts.append(f"제목: {title_elem.text.strip()}")
-        content_parts.append("-" * 50)
-    
-    # 메인 컨텐츠 영역 찾기
-    main_content = None
-    
-    # 다양한 DART 컨텐츠 컨테이너 시도
-    content_selectors = [
-        'div.contents',
-        'div#content',
-        'div.report_content',
-        'div.view_cont',
-        'div.view_content',
-        'div.doc_content',
-        'div.document',
-        'body'
-    ]
-    
-    for selector in content_selectors:
-        main_content = soup.select_one(selector)
-        if main_content:
-            break
-    
-    if not main_content:
+        emit(f"제목: {title_elem.text.strip()}")
+        emit("-" * 50)
+    
+    # 메인 컨텐츠 영역 찾기 (후보를 1회 탐색으로 모은 뒤 셀렉터 우선순위가 가장 높은 요소 선택)
+    candidates = _CONTENT_CSS.select(soup)
+    if candidates:
+        main_content = min(candidates, key=_content_priority)
+    else:
         main_content = soup.body or soup
     
     # 테이블 처리
     tables = main_content.find_all('table')
     for i, table in enumerate(tables, 1):
-        content_parts.append(f"\n[표 {i}]")
+        emit(f"\n[표 {i}]")
         rows = table.find_all('tr')
         for row in rows:
             cells = row.find_all(['th', 'td'])
             if cells:
                 row_text = ' | '.join(cell.get_text(strip=True) for cell in cells)
-                content_parts.append(row_text)
-        content_parts.append("")
+                emit(row_text)
     
-    # 텍스트 컨텐츠 추출
-    for elem in main_content.find_all(['p', 'div', 'span', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-        # 테이블 내부 요소는 이미 처리했으므로 건너뜀
-        if elem.find_parent('table'):
-            continue
-            
+    # 텍스트 컨텐츠 추출 (테이블 내부 요소는 이미 처리했으므로 테이블 하위 트리는 건너뜀)
+    for elem in _iter_text_elements(main_content):
         text = elem.get_text(strip=True)
         if text and len(text) > 10:  # 의미있는 텍스트만
             # 헤딩 태그는 구분
             if elem.name.startswith('h'):
-                content_parts.append(f"\n[{elem.name.upper()}] {text}")
+                emit(f"\n[{elem.name.upper()}] {text}")
             else:
-                content_parts.append(text)
+                emit(text)
     
-    # 중복 제거 및 정리
-    seen = set()
-    unique_parts = []
-    for part in content_parts:
-        if part not in seen and part.strip():
-            seen.add(part)
-            unique_parts.append(part)
+    return '\n'.join(content_parts)
+
+# URL -> _extract_dart_document_content 결과
+_page_cache: "OrderedDict[str, str]" = OrderedDict()
+# URL -> (원문 HTML, charset): parse_dart_advanced가 다시 요청하지 않도록 총 크기 한도 내에서만 보관
+_html_cache: "OrderedDict[str, Tuple[bytes, Optional[str]]]" = OrderedDict()
+_html_cache_bytes = 0
+
+
+def _remember_html(url: str, html: bytes, encoding: Optional[str]) -> None:
+    """원문 HTML을 보관 (총 크기가 _HTML_CACHE_BYTES를 넘으면 오래된 것부터 제거)"""
+    global _html_cache_bytes
+    if len(html) > _HTML_CACHE_BYTES:
+        return
+    old = _html_cache.pop(url, None)
+    if old is not None:
+        _html_cache_bytes -= len(old[0])
+    _html_cache[url] = (html, encoding)
+    _html_cache_bytes += len(html)
+    while _html_cache_bytes > _HTML_CACHE_BYTES:
+        _, (evicted, _) = _html_cache.popitem(last=False)
+        _html_cache_bytes -= len(evicted)
+
+
+def _take_html(url: str) -> Optional[Tuple[bytes, Optional[str]]]:
+    """보관 중인 원문 HTML을 꺼냄 (한 번 쓰면 캐시에서 제거)"""
+    global _html_cache_bytes
+    entry = _html_cache.pop(url, None)
+    if entry is not None:
+        _html_cache_bytes -= len(entry[0])
+    return entry
+
+
+async def _fetch_html(client: httpx.AsyncClient, url: str) -> Tuple[bytes, Optional[str]]:
+    """
+    페이지 원문(bytes)과 헤더의 charset 반환
     
-    return '\n'.join(unique_parts)
+    응답을 스트리밍으로 읽으며 _MAX_RESPONSE_BYTES를 넘으면 중단합니다.
+    문자열로 디코딩하지 않고 bytes를 그대로 파서에 넘깁니다 (헤더에 charset이 없으면 meta charset 사용).
+    """
+    async with client.stream("GET", url, headers=_REQUEST_HEADERS) as response:
+        response.raise_for_status()
+        
+        too_large = ValueError(f"응답 크기가 제한({_MAX_RESPONSE_BYTES // (1024 * 1024)}MB)을 초과합니다: {url}")
+        content_length = int(response.headers.get("content-length") or 0)
+        if content_length > _MAX_RESPONSE_BYTES:
+            raise too_large
+        
+        body = bytearray()
+        async for chunk in response.aiter_bytes(chunk_size=_RESPONSE_CHUNK_SIZE):
+            body += chunk
+            if len(body) > _MAX_RESPONSE_BYTES:
+                raise too_large
+        
+        return bytes(body), response.charset_encoding
+
 
-async def parse_dart_url_content(url: str) -> str:
+async def _fetch_and_parse(url: str, client: Optional[httpx.AsyncClient] = None) -> str:
     """
-    DART viewer URL의 실제 내용을 파싱하여 구조화된 텍스트로 반환합니다.
+    DART 페이지를 가져와 기본 내용을 추출합니다 (URL별 LRU 캐시).
     
-    Args:
-        url: DART viewer URL (예: 'http://dart.fss.or.kr/report/viewer.do?rcpNo=...')
+    캐시에는 추출한 텍스트만 보관하고, 원문 HTML은 parse_dart_advanced에서 재사용할 수 있도록
+    크기 한도 내에서만 잠시 보관합니다. 실패한 요청은 캐시하지 않습니다.
+    client가 주어지면 해당 클라이언트의 커넥션을 재사용합니다.
     """
+    content = _page_cache.get(url)
+    if content is not None:
+        _page_cache.move_to_end(url)
+        return content
+    
+    if client is None:
+        async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as own_client:
+            html, encoding = await _fetch_html(own_client, url)
+    else:
+        html, encoding = await _fetch_html(client, url)
+    
+    # HTML 파싱 (본문 추출에 필요한 태그만)
+    soup = _make_soup(html, parse_only=_STRAINER, from_encoding=encoding)
+    
+    # DART 특화 파싱
+    content = _extract_dart_document_content(soup, url)
+    
+    _page_cache[url] = content
+    if len(_page_cache) > _PAGE_CACHE_SIZE:
+        _page_cache.popitem(last=False)
+    _remember_html(url, html, encoding)
+    return content
+
+
+async def _parse_dart_url(url: str, client: Optional[httpx.AsyncClient] = None) -> Dict[str, Any]:
+    """parse_dart_url_content의 결과를 dict로 반환 (JSON 직렬화는 호출자가 수행)"""
     try:
-        async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
-            }
-            
-            logger.info(f"Parsing DART URL: {url}")
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
-            
-            # 인코딩 처리
-            if response.encoding is None:
-                response.encoding = 'utf-8'
-            
-            # HTML 파싱
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # DART 특화 파싱
-            content = _extract_dart_document_content(soup, url)
-            
-            return json.dumps({
-                "url": url,
-                "content": content,
-                "success": True
-            }, ensure_ascii=False)
+        logger.info(f"Parsing DART URL: {url}")
+        content = await _fetch_and_parse(url, client)
+        
+        return {
+            "url": url,
+            "content": content,
+            "success": True
+        }
             
     except Exception as e:
         logger.error(f"Error parsing DART URL: {e}")
-        return json.dumps({
+        return {
             "url": url,
             "error": str(e),
             "success": False
-        }, ensure_ascii=False)
+        }
+
+
+async def parse_dart_url_content(url: str, client: Optional[httpx.AsyncClient] = None) -> str:
+    """
+    DART viewer URL의 실제 내용을 파싱하여 구조화된 텍스트로 반환합니다.
+    
+    Args:
+        url: DART viewer URL (예: 'http://dart.fss.or.kr/report/viewer.do?rcpNo=...')
+        client: 재사용할 HTTP 클라이언트 (없으면 요청마다 생성)
+    """
+    return _dumps(await _parse_dart_url(url, client))
 
 async def parse_multiple_dart_urls(urls: str) -> str:
     """
@@ -356,31 +646,34 @@ async def parse_multiple_dart_urls(urls: str) -> str:
         url_list = [url.strip() for url in urls.split(',') if url.strip()]
     
     if not url_list:
-        return json.dumps({
+        return _dumps({
             "error": "URL 목록이 비어있습니다",
             "success": False
-        }, ensure_ascii=False)
+        })
     
     logger.info(f"Parsing {len(url_list)} DART URLs")
     
-    # 모든 URL을 병렬로 처리
-    tasks = [parse_dart_url_content(url) for url in url_list]
-    results = await asyncio.gather(*tasks)
-    
-    # 결과 정리
-    parsed_results = []
-    for result_str in results:
-        try:
-            result = json.loads(result_str)
-            parsed_results.append(result)
-        except:
-            parsed_results.append({"error": "결과 파싱 실패", "raw": result_str})
+    # 모든 URL을 병렬로 처리 (클라이언트 1개로 커넥션을 공유하고 동시 요청 수 제한)
+    semaphore = asyncio.Semaphore(_MULTI_URL_CONCURRENCY)
+    
+    async with httpx.AsyncClient(
+        http2=_HTTP2_AVAILABLE,
+        follow_redirects=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+    ) as client:
+        async def _parse_one(url: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await _parse_dart_url(url, client)
+        
+        # 결과는 dict로 받아 최종 응답에서 한 번만 직렬화
+        results = await asyncio.gather(*[_parse_one(url) for url in url_list])
     
-    return json.dumps({
+    return _dumps({
         "total_urls": len(url_list),
-        "results": parsed_results,
+        "results": results,
         "success": True
-    }, ensure_ascii=False)
+    })
 
 async def parse_dart_advanced(url: str) -> str:
     """
@@ -393,74 +686,64 @@ async def parse_dart_advanced(url: str) -> str:
         고급 분석된 정보 (JSON)
     """
     try:
-        async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
-            }
-            
-            logger.info(f"Advanced parsing DART URL: {url}")
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
-            
-            # 인코딩 처리
-            if response.encoding is None:
-                response.encoding = 'utf-8'
-            
-            # HTML 파싱
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 기본 내용 추출
-            basic_content = _extract_dart_document_content(soup, url)
-            
-            # 고급 분석
-            analysis_result = {
-                "url": url,
-                "basic_content": basic_content,
-                "metadata": _extract_metadata(soup),
-                "sections": _extract_sections(soup),
-                "tables": _extract_tables_advanced(soup),
-                "financial_data": _extract_financial_data(soup),
-                "entities": _extract_key_entities(basic_content),
-                "analysis_timestamp": datetime.now().isoformat(),
-                "success": True
-            }
-            
-            # 주요 인사이트 생성
-            insights = []
-            
-            # 재무 인사이트
-            if analysis_result["financial_data"]["key_metrics"]:
-                insights.append(f"주요 재무지표 {len(analysis_result['financial_data']['key_metrics'])}개 발견")
-            
-            # 테이블 인사이트  
-            table_types = defaultdict(int)
-            for table in analysis_result["tables"]:
-                table_types[table["type"]] += 1
-            
-            for t_type, count in table_types.items():
-                if t_type != "unknown":
-                    insights.append(f"{t_type} 테이블 {count}개 발견")
-            
-            # 엔티티 인사이트
-            if analysis_result["entities"]["companies"]:
-                insights.append(f"관련 기업 {len(analysis_result['entities']['companies'])}개 언급")
-            
-            if analysis_result["entities"]["amounts"]:
-                insights.append(f"금액 정보 {len(analysis_result['entities']['amounts'])}개 포함")
-            
-            analysis_result["insights"] = insights
-            
-            return json.dumps(analysis_result, ensure_ascii=False)
-            
+        logger.info(f"Advanced parsing DART URL: {url}")
+        # 기본 내용 추출
+        basic_content = await _fetch_and_parse(url)
+        
+        # 섹션 분리가 형제 요소 구조에 의존하므로 전체 트리 생성 (트리는 캐시하지 않음)
+        entry = _take_html(url)
+        if entry is None:
+            async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
+                entry = await _fetch_html(client, url)
+        html, encoding = entry
+        soup = _make_soup(html, from_encoding=encoding)
+        tables = _collect_tables(soup)
+        
+        # 고급 분석
+        analysis_result = {
+            "url": url,
+            "basic_content": basic_content,
+            "metadata": _extract_metadata(soup),
+            "sections": _extract_sections(soup),
+            "tables": _extract_tables_advanced(tables),
+            "financial_data": _extract_financial_data(tables),
+            "entities": _extract_key_entities(basic_content),
+            "analysis_timestamp": datetime.now().isoformat(),
+            "success": True
+        }
+        
+        # 주요 인사이트 생성
+        insights = []
+        
+        # 재무 인사이트
+        if analysis_result["financial_data"]["key_metrics"]:
+            insights.append(f"주요 재무지표 {len(analysis_result['financial_data']['key_metrics'])}개 발견")
+        
+        # 테이블 인사이트
+        table_types = Counter(table["type"] for table in analysis_result["tables"])
+        insights.extend(
+            f"{t_type} 테이블 {count}개 발견"
+            for t_type, count in table_types.items() if t_type != "unknown"
+        )
+        
+        # 엔티티 인사이트
+        if analysis_result["entities"]["companies"]:
+            insights.append(f"관련 기업 {len(analysis_result['entities']['companies'])}개 언급")
+        
+        if analysis_result["entities"]["amounts"]:
+            insights.append(f"금액 정보 {len(analysis_result['entities']['amounts'])}개 포함")
+        
+        analysis_result["insights"] = insights
+        
+        return _dumps(analysis_result)
+        
     except Exception as e:
         logger.error(f"Error in advanced DART parsing: {e}")
-        return json.dumps({
+        return _dumps({
             "url": url,
             "error": str(e),
             "success": False
-        }, ensure_ascii=False)
+        })
 
 
 async def extract_structured_info_from_documents(
@@ -514,11 +797,11 @@ async def extract_structured_info_from_documents(
             # 감사 관련 정보 추출 로직  
             extracted_info["audit_info"] = "감사정보 추출 (구현 필요)"
         
-        return json.dumps(extracted_info, ensure_ascii=False)
+        return _dumps(extracted_info)
         
     except Exception as e:
         logger.error(f"Error extracting structured info: {e}")
-        return json.dumps({
+        return _dumps({
             "error": str(e),
             "rcp_no": rcp_no
-        }, ensure_ascii=False)
\ No newline at end of file
+        })
\ No newline at end of file
@@ -7,7 +7,6 @@ import asyncio
 import time
 from typing import Optional, Dict, Any
 from collections import deque
-from datetime import datetime, timedelta
 
 from utils.logging import get_logger
 from functools import wraps
@@ -34,8 +33,8 @@ class RateLimiter:
         self.time_window = time_window
         self.burst_limit = burst_limit or max_calls
         
-        # 호출 기록 (타임스탬프 큐)
-        self.call_times = deque()
+        # 최근 max_calls개 호출의 (예약된) 실행 시각, time.monotonic() 기준
+        self.call_times = deque(maxlen=max_calls)
         
         # 대기 중인 요청 수
         self.pending_requests = 0
@@ -45,66 +44,49 @@ class RateLimiter:
             "total_calls": 0,
             "throttled_calls": 0,
             "total_wait_time": 0.0,
-            "last_reset": datetime.now()
+            "last_reset": time.monotonic()  # uptime 계산용 (벽시계 시각 아님)
         }
         
         # 세마포어 (동시 실행 제한)
         self.semaphore = asyncio.Semaphore(min(10, burst_limit or 10))
-        
-        # 락 (스레드 안전성)
-        self.lock = asyncio.Lock()
     
     async def acquire(self) -> float:
         """
         호출 권한 획득 (필요시 대기)
         
+        락 없이 실행 시각을 먼저 예약한 뒤 락 밖에서 대기한다.
+        예약은 await 없이 이루어지므로 이벤트 루프 안에서 원자적이다.
+        어떤 time_window 구간에도 max_calls개를 넘는 호출이 예약되지 않는다.
+        
         Returns:
             대기 시간 (초)
         """
-        async with self.lock:
-            now = time.time()
-            wait_time = 0.0
-            
-            # 오래된 호출 기록 정리
-            self._cleanup_old_calls(now)
-            
-            # 현재 윈도우 내 호출 수 확인
-            current_calls = len(self.call_times)
-            
-            # 제한 초과시 대기
-            if current_calls >= self.max_calls:
-                # 가장 오래된 호출이 윈도우를 벗어날 때까지 대기
-                oldest_call = self.call_times[0]
-                wait_time = max(0, self.time_window - (now - oldest_call))
-                
-                if wait_time > 0:
-                    self.stats["throttled_calls"] += 1
-                    self.stats["total_wait_time"] += wait_time
-                    self.pending_requests += 1
-                    
-                    logger.info(f"Rate limit reached. Waiting {wait_time:.2f}s "
-                              f"(pending: {self.pending_requests})")
-                    
-                    # 대기
-                    await asyncio.sleep(wait_time)
-                    self.pending_requests -= 1
-                    
-                    # 대기 후 다시 정리
-                    now = time.time()
-                    self._cleanup_old_calls(now)
+        now = time.monotonic()
+        scheduled = now
+        
+        # 윈도우 내 호출 수가 가득 찼으면 max_calls번 전 호출이 윈도우를 벗어날 때까지 대기
+        if len(self.call_times) == self.max_calls:
+            scheduled = max(now, self.call_times[0] + self.time_window)
+        
+        # 호출 기록 추가 (maxlen으로 가장 오래된 기록은 자동 제거)
+        self.call_times.append(scheduled)
+        self.stats["total_calls"] += 1
+        
+        wait_time = scheduled - now
+        if wait_time > 0:
+            self.stats["throttled_calls"] += 1
+            self.stats["total_wait_time"] += wait_time
+            self.pending_requests += 1
             
-            # 호출 기록 추가
-            self.call_times.append(now)
-            self.stats["total_calls"] += 1
+            logger.info(f"Rate limit reached. Waiting {wait_time:.2f}s "
+                      f"(pending: {self.pending_requests})")
             
-            return wait_time
-    
-    def _cleanup_old_calls(self, now: float):
-        """오래된 호출 기록 정리"""
-        cutoff = now - self.time_window
+            try:
+                await asyncio.sleep(wait_time)
+            finally:
+                self.pending_requests -= 1
         
-        while self.call_times and self.call_times[0] < cutoff:
-            self.call_times.popleft()
+        return wait_time
     
     async def __aenter__(self):
         """컨텍스트 매니저 진입"""
@@ -118,8 +100,7 @@ class RateLimiter:
     
     def get_stats(self) -> Dict[str, Any]:
         """통계 정보 반환"""
-        now = datetime.now()
-        uptime = (now - self.stats["last_reset"]).total_seconds()
+        uptime = time.monotonic() - self.stats["last_reset"]
         
         return {
             "total_calls": self.stats["total_calls"],
@@ -132,20 +113,25 @@ class RateLimiter:
                 if self.stats["throttled_calls"] > 0 else 0
             ),
             "pending_requests": self.pending_requests,
-            "current_window_calls": len(self.call_times),
+            "current_window_calls": self._current_window_calls(),
             "calls_per_minute": (
                 self.stats["total_calls"] / max(1, uptime / 60)
             ),
             "uptime_seconds": uptime
         }
     
+    def _current_window_calls(self) -> int:
+        """현재 윈도우 내 호출 수 (대기 중인 예약 포함)"""
+        cutoff = time.monotonic() - self.time_window
+        return sum(1 for call_time in self.call_times if call_time >= cutoff)
+    
     def reset_stats(self):
         """통계 초기화"""
         self.stats = {
             "total_calls": 0,
             "throttled_calls": 0,
             "total_wait_time": 0.0,
-            "last_reset": datetime.now()
+            "last_reset": time.monotonic()  # uptime 계산용 (벽시계 시각 아님)
         }
         logger.info("Rate limiter stats reset")
 
@@ -4,7 +4,11 @@ DART 심층 검색 오케스트레이터
 """
 
 import asyncio
+import heapq
 import json
+import logging
+import unicodedata
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
@@ -17,9 +21,121 @@ from utils.logging import get_logger
 from utils.cache import get_cache
 from utils.config_loader import get_config, get_openai_client
 
+# orjson (선택적) - 검색 응답 파싱/파이프라인 결과 직렬화 가속
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 # Logger 초기화
 logger = get_logger("dart_orchestrator")
 
+# 기간 분할 검색 시 동시에 보내는 DART 검색 요청 수
+_MAX_CONCURRENT_SEARCHES = 5
+
+# 오케스트레이터별 기업명 검증 결과 캐시 크기
+_COMPANY_LOOKUP_CACHE_SIZE = 1024
+
+# 모든 오케스트레이터가 공유하는 문서 가져오기 세마포어 (이벤트 루프별로 1개)
+_fetch_semaphore: Optional[asyncio.Semaphore] = None
+_fetch_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_fetch_semaphore(config) -> asyncio.Semaphore:
+    """설정(max_concurrent_fetches)으로 크기를 정한 공유 세마포어 반환 (최초 호출 시 생성)"""
+    global _fetch_semaphore, _fetch_semaphore_loop
+    loop = asyncio.get_running_loop()
+    if _fetch_semaphore is None or _fetch_semaphore_loop is not loop:
+        _fetch_semaphore = asyncio.Semaphore(config.get("max_concurrent_fetches", 3))
+        _fetch_semaphore_loop = loop
+    return _fetch_semaphore
+
+
+# 공시 대분류(pblntf_detail_ty 첫 글자) -> ((보고서명 필수 키워드, report_type) 규칙, 기본 report_type)
+# 규칙은 앞에서부터 적용하며 키워드가 모두 포함된 첫 규칙의 report_type 사용
+_REPORT_TYPE_RULES = {
+    # 정기보고서
+    "A": (
+        (
+            (("사업보고서",), "A001"),
+            (("반기보고서",), "A002"),
+            (("분기보고서",), "A003"),
+        ),
+        "A001"
+    ),
+    # 주요사항보고서
+    "B": (
+        (
+            (("주요경영",), "B002"),
+            (("최대주주",), "B003"),
+        ),
+        "B001"
+    ),
+    # 증권신고서
+    "C": (
+        (
+            (("채무",), "C002"),
+            (("채권",), "C002"),
+            (("파생",), "C003"),
+        ),
+        "C001"
+    ),
+    # 지분공시
+    "D": (
+        (
+            (("임원", "주주"), "D002"),
+            (("의결권",), "D003"),
+            (("공개매수",), "D004"),
+        ),
+        "D001"
+    ),
+}
+
+# 이 크기(바이트/문자)를 넘는 검색 응답은 스레드에서 파싱하여 이벤트 루프를 막지 않음
+_OFFLOAD_PARSE_THRESHOLD = 100_000
+
+
+def _loads(data: Any) -> Any:
+    """JSON 파싱 (orjson이 있으면 사용)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any, pretty: bool = True) -> str:
+    """
+    결과 JSON 직렬화 (orjson이 있으면 사용, 한글은 이스케이프하지 않음)
+    
+    pretty=False면 들여쓰기 없이 직렬화 (응답 크기와 직렬화 비용 감소)
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            return orjson.dumps(obj, option=option).decode("utf-8")
+        except TypeError:
+            # orjson이 지원하지 않는 타입(64비트 초과 정수 등)은 표준 json으로 처리
+            pass
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _normalize_query(query: str) -> str:
+    """
+    파이프라인 응답 캐시용 쿼리 정규화
+    
+    유니코드(NFKC)·대소문자·공백 차이만 흡수하며 단어 자체는 바꾸지 않음
+    (다른 기업/공시 유형 쿼리가 같은 응답을 공유하는 오탐 방지)
+    """
+    return " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+
+
+def _by_receipt_date(result: Dict[str, Any]) -> str:
+    """검색 결과 정렬 키 (접수일자 YYYYMMDD)"""
+    return result.get("rcept_dt", "")
+
 
 class DartOrchestrator:
     """DART 심층 검색 파이프라인"""
@@ -33,6 +149,12 @@ class DartOrchestrator:
         self.dart_reader = getattr(dart_api_tools, 'dart_reader', None)
         self.query_expander = QueryExpander(self.dart_reader)
         
+        # 기업명 -> 검증 결과 캐시 (기업 목록은 초기화 후 변하지 않으므로 결과가 결정적)
+        # 반환된 딕셔너리는 공유되므로 읽기 전용으로만 사용
+        self._find_company = lru_cache(maxsize=_COMPANY_LOOKUP_CACHE_SIZE)(
+            self.query_expander.company_validator.find_company
+        )
+        
         # LLM 클라이언트 초기화 (선택적)
         self.llm_client = get_openai_client()
         
@@ -69,6 +191,21 @@ class DartOrchestrator:
         """
         logger.info(f"Starting DART search pipeline for query: {query}")
         
+        # 실행 시작 시각 (캐시 키 날짜와 응답 타임스탬프에 같은 값 사용)
+        started_at = datetime.now()
+        
+        # 동일(정규화 기준) 쿼리의 성공 응답은 쿼리 확장·검색·필터링 없이 바로 반환
+        # "최근 3개월" 같은 상대 날짜 표현이 있으므로 날짜가 바뀌면 별도 항목으로 취급
+        pipeline_cache_params = {
+            "query": _normalize_query(query),
+            "date": started_at.strftime("%Y%m%d"),
+            "max_results_per_search": max_results_per_search
+        }
+        cached_response = await self.cache.get("search_pipeline", pipeline_cache_params)
+        if cached_response is not None:
+            logger.info("Pipeline cache hit")
+            return cached_response
+        
         try:
             # 1. Query Expansion Phase
             logger.info("Phase 1: Query Expansion")
@@ -79,7 +216,7 @@ class DartOrchestrator:
             if expanded_query.get("needs_confirmation"):
                 confirmation_result = self._handle_company_confirmation(expanded_query)
                 if confirmation_result["status"] == "needs_user_input":
-                    return json.dumps(confirmation_result, ensure_ascii=False, indent=2)
+                    return _dumps(confirmation_result, self.config.get("pretty_json", True))
                 # 사용자가 선택한 기업으로 업데이트
                 expanded_query = confirmation_result["updated_query"]
             
@@ -96,11 +233,11 @@ class DartOrchestrator:
                     },
                     "documents": [],
                     "metadata": {
-                        "synthesized_at": datetime.now().isoformat(),
+                        "synthesized_at": started_at.isoformat(),
                         "sufficiency": False
                     }
                 }
-                return json.dumps(response, ensure_ascii=False, indent=2)
+                return _dumps(response, self.config.get("pretty_json", True))
 
             # 2. Search Phase
             logger.info("Phase 2: Search Execution")
@@ -152,7 +289,13 @@ class DartOrchestrator:
                 "total_processed": len(processed_docs),
                 "processed_docs": processed_docs
             }
-            return json.dumps(test_result, ensure_ascii=False, indent=2)
+            response_json = _dumps(test_result, self.config.get("pretty_json", True))
+            # 일부 문서 내용을 가져오지 못한 응답은 캐시하지 않음 (일시적 오류가 고정되지 않도록)
+            if all(not doc.get("error") and doc.get("content") is not None for doc in processed_docs):
+                await self.cache.set("search_pipeline", pipeline_cache_params, response_json)
+            else:
+                logger.info("Skipping pipeline cache: some documents failed to fetch")
+            return response_json
             
         except Exception as e:
             logger.error(f"Pipeline error: {str(e)}")
@@ -180,81 +323,140 @@ class DartOrchestrator:
         all_results = []
         search_params_list = self.query_expander.create_search_params(expanded_query)
         
-        # 기업코드 없는 경우 롤링 검색 알림
-        if len(search_params_list) > 1 and not expanded_query.get("corp_codes"):
+        # 기업코드 없는 경우 롤링 검색 알림 (구간별 로그는 아래 태스크 생성 루프에서 함께 출력)
+        log_periods = (
+            len(search_params_list) > 1
+            and not expanded_query.get("corp_codes")
+            and logger.isEnabledFor(logging.INFO)
+        )
+        if log_periods:
             logger.info(f"🔄 기업명 없는 검색: {len(search_params_list)}개 기간으로 분할 (3개월씩 롤링)")
-            for i, params in enumerate(search_params_list, 1):
-                start = params.get('bgn_de', '')
-                end = params.get('end_de', '')
-                if start and end:
-                    start_fmt = f"{start[:4]}-{start[4:6]}-{start[6:8]}"
-                    end_fmt = f"{end[:4]}-{end[4:6]}-{end[6:8]}"
-                    logger.info(f"  📅 구간 {i}: {start_fmt} ~ {end_fmt}")
-        
-        # 병렬 검색 실행
-        if len(search_params_list) > 1 and expanded_query.get("search_strategy", {}).get("parallel_search"):
+        
+        # 검색 실행 (최대 _MAX_CONCURRENT_SEARCHES개씩 동시에 요청하고, 결과는 구간 순서대로 소비)
+        # 병렬 검색이 아니면 누적 결과가 충분할 때 나머지 구간 검색을 취소
+        stop_early = not (
+            len(search_params_list) > 1
+            and expanded_query.get("search_strategy", {}).get("parallel_search")
+        )
+        if not stop_early:
             logger.info(f"Executing {len(search_params_list)} parallel searches")
-            
-            tasks = []
-            for params in search_params_list:
-                tasks.append(self._search_disclosures(params))
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            for result in results:
-                if not isinstance(result, Exception):
-                    all_results.extend(result)
-        else:
-            # 순차 검색
-            for i, params in enumerate(search_params_list, 1):
+        
+        # 캐시 일괄 조회 (캐시에 없는 구간만 검색)
+        cache_params_list = [self._build_cache_params(params) for params in search_params_list]
+        cached_list = await self.cache.mget("search_company_disclosures", cache_params_list)
+        
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_SEARCHES)
+        
+        async def _bounded_search(cache_params: Dict[str, Any]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self._search_disclosures(cache_params)
+        
+        tasks = []
+        for i, (params, cache_params, cached) in enumerate(
+            zip(search_params_list, cache_params_list, cached_list), 1
+        ):
+            # 캐시 파라미터에 이미 YYYY-MM-DD로 변환된 날짜를 재사용
+            if log_periods and cache_params["start_date"] and cache_params["end_date"]:
+                logger.info(f"  📅 구간 {i}: {cache_params['start_date']} ~ {cache_params['end_date']}")
+            if stop_early:
                 period_info = f"[{i}/{len(search_params_list)}]" if len(search_params_list) > 1 else ""
                 logger.info(f"Executing search {period_info}: {params.get('bgn_de', 'N/A')} ~ {params.get('end_de', 'N/A')}")
                 logger.info(f"  → Search params: {params}")  # 전체 파라미터 로깅
-                results = await self._search_disclosures(params)
-                all_results.extend(results)
-                
-                logger.info(f"  → {len(results)}건 검색, 누적 {len(all_results)}건")
+            if cached is not None:
+                logger.debug(f"Cache hit for search params: {cache_params}")
+                tasks.append(None)
+            else:
+                tasks.append(asyncio.create_task(_bounded_search(cache_params)))
+        
+        # 새로 검색한 결과는 모아서 한 번에 캐시에 저장
+        to_cache = []
+        consumed = set()
+        seen_keys = set()
+        rejected_count = 0
+        missing_count = 0
+        try:
+            for task, cache_params, cached in zip(tasks, cache_params_list, cached_list):
+                consumed.add(id(task))
+                if task is None:
+                    results = cached
+                else:
+                    try:
+                        results = await task
+                    except Exception as e:
+                        logger.error(f"Search task error: {str(e)}")
+                        continue
+                    if results:
+                        to_cache.append((cache_params, results))
+                # 접수번호 필드명 정규화 (rcept_no 또는 rcp_no -> _uid, 이후 단계는 _uid만 조회)
+                # 누적하면서 중복 제거 (구간이 겹쳐도 새 문서만 추가, 키별로 처음 나온 결과 유지)
+                for result in results:
+                    result["_uid"] = result.get("rcept_no") or result.get("rcp_no")
+                    key = result["_uid"]
+                    if not key:
+                        missing_count += 1
+                        key = f"{result.get('corp_name', '')}-{result.get('report_nm', '')}-{result.get('rcept_dt', '')}"
+                    if key in seen_keys:
+                        rejected_count += 1
+                        continue
+                    seen_keys.add(key)
+                    all_results.append(result)
                 
-                # 충분한 결과가 있으면 중단
-                if len(all_results) >= max_results:
-                    logger.info(f"충분한 결과 수집 ({len(all_results)}건), 검색 중단")
-                    break
-        
-        # 중복 제거 및 정렬
-        logger.info(f"Before deduplication: {len(all_results)} results")
-        unique_results = self._deduplicate_results(all_results)
-        logger.info(f"After deduplication: {len(unique_results)} results")
-        
-        # 결과 수 제한
-        return unique_results[:max_results]
+                if stop_early:
+                    logger.info(f"  → {len(results)}건 검색, 누적 {len(all_results)}건")
+                    
+                    # 충분한 결과가 있으면 중단
+                    if len(all_results) >= max_results:
+                        logger.info(f"충분한 결과 수집 ({len(all_results)}건), 검색 중단")
+                        break
+        finally:
+            # 조기 중단 시 이미 끝난 구간 검색 결과는 캐시에만 저장하고, 남은 구간 검색은 취소
+            for task, cache_params in zip(tasks, cache_params_list):
+                if (
+                    task is not None and id(task) not in consumed and task.done()
+                    and not task.cancelled() and task.exception() is None and task.result()
+                ):
+                    to_cache.append((cache_params, task.result()))
+            pending = [task for task in tasks if task is not None and not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        if to_cache:
+            await self.cache.mset("search_company_disclosures", to_cache)
+            logger.debug(f"Cached {len(to_cache)} search results")
+        
+        if missing_count:
+            # 접수번호가 없어도 결과에 포함 (회사명-보고서명-접수일자를 식별자로 사용)
+            logger.warning(f"No rcept_no found in {missing_count} results")
+        logger.debug(f"Deduplication rejected {rejected_count} results in flight")
+        logger.info(f"After deduplication: {len(all_results)} results")
+        
+        # 최신순 정렬 (상위 max_results개)
+        return self._select_latest(all_results, max_results)
+    
+    def _build_cache_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """검색 파라미터를 search_company_disclosures 호출/캐시 키용 파라미터로 변환"""
+        return {
+            "company": params.get("corp_code"),
+            "start_date": self._format_date_for_api(params.get("bgn_de")),
+            "end_date": self._format_date_for_api(params.get("end_de")),
+            "pblntf_detail_ty": params.get("pblntf_detail_ty")  # 상세유형 그대로 사용
+        }
     
-    async def _search_disclosures(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def _search_disclosures(self, cache_params: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
-        DART 공시 검색 실행 (캐싱 적용)
+        DART 공시 검색 실행 (캐시 조회/저장은 _execute_searches에서 일괄 처리)
         
         Args:
-            params: 검색 파라미터
+            cache_params: _build_cache_params로 만든 검색 파라미터
             
         Returns:
             검색 결과 리스트
         """
-        # 캐시 키 생성용 파라미터
-        cache_params = {
-            "company": params.get("corp_code"),
-            "start_date": self._format_date_for_api(params.get("bgn_de")),
-            "end_date": self._format_date_for_api(params.get("end_de")),
-            "pblntf_detail_ty": params.get("pblntf_detail_ty")  # 상세유형 그대로 사용
-        }
-        
         # Phase 2 Search Execution - 파라미터 로깅 (Phase 1에서 선택한 문서 유형 확인)
         logger.info(f"Phase 2 Search Execution - cache_params: {cache_params}")
-        logger.info(f"  → pblntf_detail_ty (문서유형): {params.get('pblntf_detail_ty', 'None')}")
-        
-        # 캐시 확인
-        cached_result = await self.cache.get("search_company_disclosures", cache_params)
-        if cached_result is not None:
-            logger.debug(f"Cache hit for search params: {cache_params}")
-            return cached_result
+        logger.info(f"  → pblntf_detail_ty (문서유형): {cache_params['pblntf_detail_ty']}")
         
         try:
             # dart_api_tools의 search_company_disclosures 함수 호출
@@ -262,9 +464,12 @@ class DartOrchestrator:
                 **cache_params
             )
             
-            # JSON 파싱
-            if isinstance(result_json, str):
-                result_data = json.loads(result_json)
+            # JSON 파싱 (큰 응답은 스레드에서 파싱)
+            if isinstance(result_json, (str, bytes)):
+                if len(result_json) > _OFFLOAD_PARSE_THRESHOLD:
+                    result_data = await asyncio.to_thread(_loads, result_json)
+                else:
+                    result_data = _loads(result_json)
             else:
                 result_data = result_json
             
@@ -283,11 +488,6 @@ class DartOrchestrator:
                 else:
                     results = result_data.get("list", [])
             
-            # 캐시에 저장
-            if results:
-                await self.cache.set("search_company_disclosures", cache_params, results)
-                logger.debug(f"Cached {len(results)} search results")
-            
             return results
             
         except Exception as e:
@@ -317,31 +517,15 @@ class DartOrchestrator:
             
         return None
     
-    def _deduplicate_results(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """중복 결과 제거"""
-        seen = set()
-        unique = []
-        
-        for result in results:
-            # rcept_no를 기준으로 중복 체크
-            key = result.get("rcept_no") or result.get("rcp_no")
-            if key:
-                if key not in seen:
-                    seen.add(key)
-                    unique.append(result)
-            else:
-                # 접수번호가 없는 경우 디버깅용 로그
-                logger.warning(f"No rcept_no found in result: {list(result.keys())}")
-                # 접수번호가 없어도 결과에 포함 (다른 고유 식별자 시도)
-                backup_key = f"{result.get('corp_name', '')}-{result.get('report_nm', '')}-{result.get('rcept_dt', '')}"
-                if backup_key not in seen:
-                    seen.add(backup_key)
-                    unique.append(result)
-        
-        # 날짜순 정렬 (최신순)
-        unique.sort(key=lambda x: x.get("rcept_dt", ""), reverse=True)
-        
-        return unique
+    def _select_latest(
+        self,
+        results: List[Dict[str, Any]],
+        max_results: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """최신순 정렬 (max_results가 있으면 상위 max_results개만 반환, 같은 날짜는 먼저 나온 순서 유지)"""
+        if max_results is not None and max_results < len(results):
+            return heapq.nlargest(max_results, results, key=_by_receipt_date)
+        return sorted(results, key=_by_receipt_date, reverse=True)
     
     async def _process_documents(
         self,
@@ -367,7 +551,7 @@ class DartOrchestrator:
         
         # 1. 기본 정보 처리 (이미 필터링되고 정렬된 문서들)
         for idx, result in enumerate(filtered_results):
-            rcept_no = result.get("rcept_no") or result.get("rcp_no")
+            rcept_no = result["_uid"]
 
             doc_info = {
                 "index": idx + 1,
@@ -391,19 +575,31 @@ class DartOrchestrator:
             logger.info(f"Fetching content for top {len(docs_to_fetch)} documents")
             
             # 각 문서에 corp_code 추가 (company_validator 사용)
+            # 고유 기업명만 스레드에서 동시에 조회하여 퍼지 매칭이 이벤트 루프를 막지 않도록 함
+            unique_names = list(dict.fromkeys(
+                doc["corp_name"] for doc in docs_to_fetch
+                if doc.get("corp_name") and not doc.get("corp_code")
+            ))
+            validations = await asyncio.gather(*(
+                asyncio.to_thread(self._find_company, name) for name in unique_names
+            ))
+            name_to_code = {
+                name: validation["corp_code"]
+                for name, validation in zip(unique_names, validations)
+                if validation["status"] in ("exact", "fuzzy") and validation.get("corp_code")
+            }
             for doc in docs_to_fetch:
-                if doc.get("corp_name") and not doc.get("corp_code"):
-                    # 회사명으로 corp_code 조회 (query_expander의 company_validator 활용)
-                    validation = self.query_expander.company_validator.find_company(doc["corp_name"])
-                    if validation["status"] in ["exact", "fuzzy"] and validation.get("corp_code"):
-                        doc["corp_code"] = validation["corp_code"]
+                if not doc.get("corp_code") and doc.get("corp_name") in name_to_code:
+                    doc["corp_code"] = name_to_code[doc["corp_name"]]
             
             # 개선된 문서 내용 가져오기 (상세 타입 전달)
             detailed_types = expanded_query.get("detailed_types", {})
+            max_concurrent = self.config.get("max_concurrent_fetches", 3)
             fetched_contents = await self.document_fetcher.fetch_multiple_documents(
                 docs_to_fetch,
-                max_concurrent=3,
-                detailed_types=detailed_types
+                max_concurrent=max_concurrent,
+                detailed_types=detailed_types,
+                semaphore=_get_fetch_semaphore(self.config)
             )
             
             # 가져온 내용을 문서 정보에 병합
@@ -424,22 +620,24 @@ class DartOrchestrator:
     
     
     def _extract_summary(self, result: Dict[str, Any]) -> str:
-        """문서 요약 추출"""
-        parts = []
-        
-        if result.get("report_nm"):
-            parts.append(result["report_nm"])
-            
-        if result.get("rm"):  # 비고
-            parts.append(f"비고: {result['rm']}")
-            
-        return " | ".join(parts) if parts else "요약 없음"
+        """문서 요약 추출 (보고서명 | 비고)"""
+        report_nm = result.get("report_nm")
+        remark = result.get("rm")  # 비고
+        
+        if report_nm and remark:
+            return f"{report_nm} | 비고: {remark}"
+        if report_nm:
+            return report_nm
+        if remark:
+            return f"비고: {remark}"
+        return "요약 없음"
     
     async def _synthesize_response(
         self,
         query: str,
         processed_docs: List[Dict[str, Any]],
-        expanded_query: Dict[str, Any]
+        expanded_query: Dict[str, Any],
+        started_at: Optional[datetime] = None
     ) -> str:
         """
         최종 응답 생성
@@ -448,6 +646,7 @@ class DartOrchestrator:
             query: 원본 쿼리
             processed_docs: 처리된 문서
             expanded_query: 확장된 쿼리
+            started_at: 파이프라인 실행 시작 시각 (없으면 현재 시각)
             
         Returns:
             JSON 형식의 최종 응답
@@ -455,22 +654,33 @@ class DartOrchestrator:
         # 주요 문서 선택 (상위 10개)
         top_docs = processed_docs[:10]
         
-        # 통계 정보 생성
+        # 통계 정보 생성 (기업 목록, 공시 기간, 보고서 유형별 집계를 한 번의 순회로 계산)
+        companies = {}  # 처음 나온 순서 유지
+        earliest = latest = ""
+        report_types = {}
+        for doc in processed_docs:
+            corp_name = doc.get("corp_name")
+            if corp_name:
+                companies[corp_name] = None
+            rcept_dt = doc.get("rcept_dt")
+            if rcept_dt:
+                if not earliest or rcept_dt < earliest:
+                    earliest = rcept_dt
+                if not latest or rcept_dt > latest:
+                    latest = rcept_dt
+            report_type = doc.get("report_nm", "기타")
+            report_types[report_type] = report_types.get(report_type, 0) + 1
+        
         stats = {
             "total_results": len(processed_docs),
-            "companies": list(set(doc["corp_name"] for doc in processed_docs if doc.get("corp_name"))),
+            "companies": list(companies),
             "date_range": {
-                "earliest": min((doc["rcept_dt"] for doc in processed_docs if doc.get("rcept_dt")), default=""),
-                "latest": max((doc["rcept_dt"] for doc in processed_docs if doc.get("rcept_dt")), default="")
+                "earliest": earliest,
+                "latest": latest
             },
-            "report_types": {}
+            "report_types": report_types
         }
         
-        # 보고서 유형별 집계
-        for doc in processed_docs:
-            report_type = doc.get("report_nm", "기타")
-            stats["report_types"][report_type] = stats["report_types"].get(report_type, 0) + 1
-        
         # 응답 구성
         response = {
             "status": "success",
@@ -484,10 +694,10 @@ class DartOrchestrator:
             "statistics": stats,
             "top_results": top_docs,
             "summary": self._generate_summary(query, top_docs, stats),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": (started_at or datetime.now()).isoformat()
         }
         
-        return json.dumps(response, ensure_ascii=False, indent=2)
+        return _dumps(response, self.config.get("pretty_json", True))
     
     def _handle_company_confirmation(self, expanded_query: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -588,43 +798,14 @@ class DartOrchestrator:
             # pblntf_detail_ty가 없으면 report_nm에서 추론
             return self.document_fetcher._infer_report_type({"report_nm": report_nm})
         
-        # pblntf_detail_ty의 첫 글자로 대분류 판단
-        if pblntf_detail_ty.startswith("A"):
-            # 정기보고서
-            if "사업보고서" in report_nm:
-                return "A001"
-            elif "반기보고서" in report_nm:
-                return "A002"
-            elif "분기보고서" in report_nm:
-                return "A003"
-            else:
-                return "A001"  # 기본값
-        elif pblntf_detail_ty.startswith("B"):
-            # 주요사항보고서
-            if "주요경영" in report_nm:
-                return "B002"
-            elif "최대주주" in report_nm:
-                return "B003"
-            else:
-                return "B001"  # 기본값
-        elif pblntf_detail_ty.startswith("C"):
-            # 증권신고서
-            if "채무" in report_nm or "채권" in report_nm:
-                return "C002"
-            elif "파생" in report_nm:
-                return "C003"
-            else:
-                return "C001"  # 기본값
-        elif pblntf_detail_ty.startswith("D"):
-            # 지분공시
-            if "임원" in report_nm and "주주" in report_nm:
-                return "D002"
-            elif "의결권" in report_nm:
-                return "D003"
-            elif "공개매수" in report_nm:
-                return "D004"
-            else:
-                return "D001"  # 기본값
+        # pblntf_detail_ty의 첫 글자로 대분류 판단 후 보고서명 키워드 규칙을 순서대로 적용
+        bucket = _REPORT_TYPE_RULES.get(pblntf_detail_ty[0])
+        if bucket is not None:
+            rules, default_code = bucket
+            for keywords, code in rules:
+                if all(keyword in report_nm for keyword in keywords):
+                    return code
+            return default_code
         
         # 기본적으로는 document_fetcher의 추론 로직 사용
         return self.document_fetcher._infer_report_type({"report_nm": report_nm})
@@ -4,23 +4,144 @@
 LLM 사용 가능 시 LLM 활용, 불가능 시 규칙 기반 폴백
 """
 
+import heapq
+import os
 import re
 import json
-from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
+from bisect import bisect_right
+from collections import defaultdict
+from functools import lru_cache
+from itertools import accumulate
+from types import MappingProxyType
+from typing import List, DefaultDict, Dict, Mapping, Tuple, Optional
+from dataclasses import dataclass, field
 
 from utils.logging import get_logger
 
+# Aho-Corasick (선택적) - 매핑 키워드를 텍스트 1회 스캔으로 찾음
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
+# orjson (선택적) - LLM 응답 JSON 파싱 가속
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 logger = get_logger("doc_type_mapper")
 
+# map_queries_batch에서 쿼리를 이어 붙일 때 쓰는 구분자 (매핑 키워드에 나오지 않는 문자)
+_BATCH_SEPARATOR = "\x1f"
+
+# LLM 응답에서 JSON 배열 부분 추출
+_JSON_ARRAY_RE = re.compile(r'\[.*\]', re.DOTALL)
+
+# 문서명/키워드 텍스트 -> 매칭 결과 캐시 크기 (LangExtract가 같은 값을 반복해서 추출하는 경우가 많음)
+_DOC_MATCH_CACHE_SIZE = 1024
+
+# LLM 문서유형 분석 프롬프트 (query, parsed_info, context를 채워 사용)
+_LLM_PROMPT_TEMPLATE = """
+다음 사용자 쿼리를 분석하여 가장 적절한 DART 문서유형을 선택하세요.
+
+**사용자 쿼리**: {query}
+
+**파싱된 정보**:
+{parsed_info}
+
+**사용 가능한 DART 문서유형**:
+{context}
+
+**지시사항**:
+1. 사용자 쿼리의 의도와 파싱된 정보를 종합적으로 분석하세요
+2. 위의 문서유형 중에서 가장 적절한 것을 최대 3개 선택하세요
+3. 각 선택에 대한 신뢰도(0.0-1.0)를 제공하세요
+4. 반드시 JSON 형식으로 답변하세요
+
+**응답 형식**:
+[{{"code": "문서코드", "confidence": 0.0-1.0, "reason": "선택 이유"}}]
+"""
+
+# 문서유형 코드 -> 문서유형명 (읽기 전용)
+_DOC_NAMES: Mapping[str, str] = MappingProxyType({
+    # A: 정기보고서
+    "A001": "사업보고서", "A002": "반기보고서", "A003": "분기보고서",
+    "A004": "등록법인결산서류", "A005": "소액공모법인결산서류",
+    
+    # B: 주요사항보고서
+    "B001": "주요사항보고서", "B002": "주요경영사항신고", "B003": "최대주주등과의거래신고",
+    
+    # C: 증권신고서
+    "C001": "증권신고(지분증권)", "C002": "증권신고(채무증권)", "C003": "증권신고(파생결합증권)",
+    "C004": "증권신고(합병등)", "C005": "증권신고(기타)", "C006": "소액공모(지분증권)",
+    "C007": "소액공모(채무증권)", "C008": "소액공모(파생결합증권)", "C009": "소액공모(합병등)",
+    "C010": "소액공모(기타)", "C011": "호가중개시스템을통한소액매출",
+    
+    # D: 지분공시
+    "D001": "주식등의대량보유상황보고서", "D002": "임원ㆍ주요주주특정증권등소유상황보고서",
+    "D003": "의결권대리행사권유", "D004": "공개매수", "D005": "임원ㆍ주요주주특정증권등거래계획보고서",
+    
+    # E: 기타주요공시
+    "E001": "자기주식취득/처분", "E002": "신탁계약체결/해지", "E003": "합병등종료보고서",
+    "E004": "주식매수선택권부여에관한신고", "E005": "사외이사에관한신고", "E006": "주주총회소집보고서",
+    "E007": "시장조성/안정조작", "E008": "합병등신고서", "E009": "금융위등록/취소",
+    "E010": "이중상환청구권부채권(커버드본드)",
+    
+    # F: 감사보고서
+    "F001": "감사보고서", "F002": "연결감사보고서", "F003": "결합감사보고서",
+    "F004": "회계법인사업보고서", "F005": "감사전재무제표미제출신고서",
+    
+    # G: 집합투자
+    "G001": "증권신고(집합투자증권-신탁형)", "G002": "증권신고(집합투자증권-회사형)",
+    "G003": "증권신고(집합투자증권-합병)",
+    
+    # H: 자산유동화
+    "H001": "자산유동화계획/양도등록", "H002": "사업/반기/분기보고서",
+    "H003": "증권신고(유동화증권등)", "H004": "채권유동화계획/양도등록",
+    "H005": "자산유동화관련중요사항발생등보고", "H006": "주요사항보고서",
+    
+    # I: 거래소공시
+    "I001": "수시공시", "I002": "공정공시", "I003": "시장조치/안내",
+    "I004": "지분공시", "I005": "증권투자회사", "I006": "채권공시",
+    
+    # J: 공정위공시
+    "J001": "대규모내부거래관련", "J002": "대규모내부거래관련(구)",
+    "J004": "기업집단현황공시", "J005": "비상장회사중요사항공시",
+    "J006": "기타공정위공시", "J008": "대규모내부거래관련(공익법인용)",
+    "J009": "하도급대금결제조건공시"
+})
+
+
+def _loads(data: str):
+    """JSON 파싱 (orjson이 있으면 사용, orjson이 거부하는 NaN 등 비표준 값은 json으로 처리)"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DocTypeMapping:
-    """문서유형 매핑 정보"""
+    """문서유형 매핑 정보 (불변, 키워드는 튜플로 저장)"""
     code: str
     name: str
-    keywords: List[str]
+    keywords: Tuple[str, ...]
     priority: int = 0
+    # 소문자로 비교하는 매칭용 (생성 시 1회 계산)
+    name_lower: str = field(init=False, repr=False, compare=False)
+    keywords_lower: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "keywords", tuple(self.keywords))
+        object.__setattr__(self, "name_lower", self.name.lower())
+        object.__setattr__(self, "keywords_lower", tuple(keyword.lower() for keyword in self.keywords))
 
 
 class DocTypeMapper:
@@ -34,6 +155,38 @@ class DocTypeMapper:
         self.llm_client = llm_client
         self.fallback_mappings = self._initialize_mappings()
         
+        # LLM 모델명 (호출마다 환경변수를 다시 읽지 않음)
+        self._model_name = os.getenv("LLM_MODEL", "gpt-3.5-turbo")
+        
+        # (매핑 인덱스, 키워드 인덱스) 목록과 이를 소문자 키워드 / 그 부분 문자열로 찾는 인덱스
+        self._keyword_pairs = [
+            (mapping_idx, keyword_idx)
+            for mapping_idx, mapping in enumerate(self.fallback_mappings)
+            for keyword_idx in range(len(mapping.keywords))
+        ]
+        self._keyword_substrings = self._build_keyword_substrings()
+        self._keyword_automaton = self._build_keyword_automaton() if AHOCORASICK_AVAILABLE else None
+        
+        # 문서명 매칭용: 소문자 매핑명 -> 코드 (같은 이름이면 앞선 매핑 우선), (소문자 매핑명, 코드) 목록
+        self._names_lower = [(mapping.name_lower, mapping.code) for mapping in self.fallback_mappings]
+        self._name_lower_to_code: Dict[str, str] = {}
+        for name_lower, code in self._names_lower:
+            self._name_lower_to_code.setdefault(name_lower, code)
+        
+        # 매핑 테이블은 초기화 후 변하지 않으므로 문서명별 매칭 결과를 인스턴스 단위로 캐싱
+        self._find_best_document_match = lru_cache(maxsize=_DOC_MATCH_CACHE_SIZE)(self._find_best_document_match)
+        
+        # 텍스트별 키워드 매칭 결과 캐싱 (LangExtract 키워드/문서명은 같은 값이 반복됨, 결과는 불변 튜플)
+        self._find_keywords_in = lru_cache(maxsize=_DOC_MATCH_CACHE_SIZE)(self._find_keywords_in)
+        self._find_related_keywords = lru_cache(maxsize=_DOC_MATCH_CACHE_SIZE)(self._find_related_keywords)
+        
+        # LLM 프롬프트에 넣는 매핑 컨텍스트 (매핑 테이블이 고정이므로 1회만 생성)
+        self._mapping_context = self._build_mapping_context()
+        
+        # 매핑 인덱스 -> (코드, 가중 점수): LangExtract 키워드 매칭(우선순위 x2) / 쿼리 키워드 매칭(우선순위 x0.5)
+        self._keyword_match_weights = [(mapping.code, mapping.priority * 2) for mapping in self.fallback_mappings]
+        self._query_match_weights = [(mapping.code, mapping.priority * 0.5) for mapping in self.fallback_mappings]
+        
     def _initialize_mappings(self) -> List[DocTypeMapping]:
         """기본 매핑 테이블 (LLM 실패 시 폴백)"""
         return [
@@ -89,6 +242,43 @@ class DocTypeMapper:
                          ["공정공시"], 8),
         ]
     
+    def _build_keyword_automaton(self):
+        """매핑 키워드로 Aho-Corasick 오토마톤 생성 (값: 해당 키워드의 (매핑 인덱스, 키워드 인덱스) 목록)"""
+        pairs_by_keyword: Dict[str, List[Tuple[int, int]]] = {}
+        for mapping_idx, keyword_idx in self._keyword_pairs:
+            keyword = self.fallback_mappings[mapping_idx].keywords_lower[keyword_idx]
+            pairs_by_keyword.setdefault(keyword, []).append((mapping_idx, keyword_idx))
+        
+        automaton = ahocorasick.Automaton()
+        for keyword, pairs in pairs_by_keyword.items():
+            automaton.add_word(keyword, tuple(pairs))
+        automaton.make_automaton()
+        return automaton
+    
+    def _build_keyword_substrings(self) -> Dict[str, Tuple[Tuple[int, int], ...]]:
+        """키워드의 모든 부분 문자열(빈 문자열 포함) -> 그 문자열을 포함하는 (매핑 인덱스, 키워드 인덱스) 목록"""
+        substrings: Dict[str, List[Tuple[int, int]]] = {}
+        for mapping_idx, keyword_idx in self._keyword_pairs:
+            keyword = self.fallback_mappings[mapping_idx].keywords_lower[keyword_idx]
+            parts = {keyword[i:j] for i in range(len(keyword)) for j in range(i + 1, len(keyword) + 1)}
+            parts.add("")
+            for part in parts:
+                substrings.setdefault(part, []).append((mapping_idx, keyword_idx))
+        return {part: tuple(pairs) for part, pairs in substrings.items()}
+    
+    def _find_keywords_in(self, text: str) -> Tuple[Tuple[int, int], ...]:
+        """text에 포함된 매핑 키워드의 (매핑 인덱스, 키워드 인덱스) 목록 (키워드 in text, 매핑/키워드 순서)"""
+        if self._keyword_automaton is not None:
+            return tuple(sorted({pair for _, pairs in self._keyword_automaton.iter(text) for pair in pairs}))
+        return tuple(
+            (mapping_idx, keyword_idx) for mapping_idx, keyword_idx in self._keyword_pairs
+            if self.fallback_mappings[mapping_idx].keywords_lower[keyword_idx] in text
+        )
+    
+    def _find_related_keywords(self, text: str) -> Tuple[Tuple[int, int], ...]:
+        """키워드가 text에 포함되거나 text가 키워드에 포함되는 (매핑 인덱스, 키워드 인덱스) 목록 (매핑/키워드 순서)"""
+        return tuple(sorted(frozenset(self._find_keywords_in(text)).union(self._keyword_substrings.get(text, ()))))
+    
     async def map_query_to_doc_types(self, query: str, langextract_result: Optional[Dict] = None, max_types: int = 3) -> List[Tuple[str, float]]:
         """
         쿼리와 LangExtract 결과를 종합하여 적절한 문서유형 코드 추출
@@ -133,65 +323,8 @@ class DocTypeMapper:
         컨텍스트 기반 LLM 분석 (비동기)
         _initialize_mappings의 정보를 컨텍스트로 제공하여 더 정확한 매핑 수행
         """
-        if not self.llm_client:
-            return []
-            
-        try:
-            import os
-            model_name = os.getenv("LLM_MODEL", "gpt-3.5-turbo")
-            
-            # 매핑 컨텍스트 생성
-            context = self._build_mapping_context()
-            
-            # 파싱 결과 정리
-            parsed_info = self._format_langextract_result(langextract_result)
-            
-            # 개선된 프롬프트 구성
-            prompt = f"""
-다음 사용자 쿼리를 분석하여 가장 적절한 DART 문서유형을 선택하세요.
-
-**사용자 쿼리**: {query}
-
-**파싱된 정보**:
-{parsed_info}
-
-**사용 가능한 DART 문서유형**:
-{context}
-
-**지시사항**:
-1. 사용자 쿼리의 의도와 파싱된 정보를 종합적으로 분석하세요
-2. 위의 문서유형 중에서 가장 적절한 것을 최대 3개 선택하세요
-3. 각 선택에 대한 신뢰도(0.0-1.0)를 제공하세요
-4. 반드시 JSON 형식으로 답변하세요
-
-**응답 형식**:
-[{{"code": "문서코드", "confidence": 0.0-1.0, "reason": "선택 이유"}}]
-"""
-            
-            response = self.llm_client.chat.completions.create(
-                model=model_name,
-                messages=[
-                    {"role": "system", "content": "You are a DART document classification expert. Analyze queries and select the most appropriate document types based on the given context."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1,
-                max_tokens=300
-            )
-            
-            content = response.choices[0].message.content.strip()
-            
-            # JSON 파싱
-            json_match = re.search(r'\[.*\]', content, re.DOTALL)
-            if json_match:
-                result = json.loads(json_match.group())
-                results = [(item["code"], item["confidence"]) for item in result if item.get("code") and item.get("confidence")]
-                logger.info(f"LLM 컨텍스트 분석 결과: {results}")
-                return results
-                
-        except Exception as e:
-            logger.error(f"LLM context analysis error: {e}")
-            
-        return []
+        # LLM 클라이언트가 동기 API이므로 동기 버전과 같은 경로 사용
+        return self._analyze_with_llm_context_sync(query, langextract_result)
 
     def _analyze_with_llm_context_sync(self, query: str, langextract_result: Optional[Dict] = None) -> List[Tuple[str, float]]:
         """
@@ -201,62 +334,44 @@ class DocTypeMapper:
             return []
             
         try:
-            import os
-            model_name = os.getenv("LLM_MODEL", "gpt-3.5-turbo")
-            
-            # 매핑 컨텍스트 생성
-            context = self._build_mapping_context()
-            
-            # 파싱 결과 정리
-            parsed_info = self._format_langextract_result(langextract_result)
-            
-            # 개선된 프롬프트 구성
-            prompt = f"""
-다음 사용자 쿼리를 분석하여 가장 적절한 DART 문서유형을 선택하세요.
-
-**사용자 쿼리**: {query}
-
-**파싱된 정보**:
-{parsed_info}
-
-**사용 가능한 DART 문서유형**:
-{context}
-
-**지시사항**:
-1. 사용자 쿼리의 의도와 파싱된 정보를 종합적으로 분석하세요
-2. 위의 문서유형 중에서 가장 적절한 것을 최대 3개 선택하세요
-3. 각 선택에 대한 신뢰도(0.0-1.0)를 제공하세요
-4. 반드시 JSON 형식으로 답변하세요
-
-**응답 형식**:
-[{{"code": "문서코드", "confidence": 0.0-1.0, "reason": "선택 이유"}}]
-"""
-            
             response = self.llm_client.chat.completions.create(
-                model=model_name,
-                messages=[
-                    {"role": "system", "content": "You are a DART document classification expert. Analyze queries and select the most appropriate document types based on the given context."},
-                    {"role": "user", "content": prompt}
-                ],
+                model=self._model_name,
+                messages=self._build_llm_messages(query, langextract_result),
                 temperature=0.1,
                 max_tokens=300
             )
-            
-            content = response.choices[0].message.content.strip()
-            
-            # JSON 파싱
-            json_match = re.search(r'\[.*\]', content, re.DOTALL)
-            if json_match:
-                result = json.loads(json_match.group())
-                results = [(item["code"], item["confidence"]) for item in result if item.get("code") and item.get("confidence")]
-                logger.info(f"LLM 컨텍스트 분석 결과: {results}")
-                return results
+            return self._parse_llm_response(response.choices[0].message.content)
                 
         except Exception as e:
             logger.error(f"LLM context analysis error: {e}")
             
         return []
 
+    def _build_llm_messages(self, query: str, langextract_result: Optional[Dict]) -> List[Dict[str, str]]:
+        """LLM 문서유형 분석 요청 메시지 구성"""
+        # 파싱 결과 정리
+        parsed_info = self._format_langextract_result(langextract_result)
+        
+        # 개선된 프롬프트 구성 (매핑 컨텍스트는 초기화 시 1회 생성)
+        prompt = _LLM_PROMPT_TEMPLATE.format(query=query, parsed_info=parsed_info, context=self._mapping_context)
+        
+        return [
+            {"role": "system", "content": "You are a DART document classification expert. Analyze queries and select the most appropriate document types based on the given context."},
+            {"role": "user", "content": prompt}
+        ]
+
+    def _parse_llm_response(self, content: str) -> List[Tuple[str, float]]:
+        """LLM 응답에서 [(문서유형코드, 신뢰도)] 추출 (JSON 배열이 없으면 빈 리스트)"""
+        # JSON 파싱
+        json_match = _JSON_ARRAY_RE.search(content.strip())
+        if not json_match:
+            return []
+        
+        result = _loads(json_match.group())
+        results = [(item["code"], item["confidence"]) for item in result if item.get("code") and item.get("confidence")]
+        logger.info(f"LLM 컨텍스트 분석 결과: {results}")
+        return results
+
     def _build_mapping_context(self) -> str:
         """매핑 컨텍스트 구성 - _initialize_mappings의 정보를 문자열로 변환"""
         context_lines = []
@@ -315,7 +430,7 @@ class DocTypeMapper:
             [(문서유형코드, 신뢰도)] 리스트
         """
         logger.info("향상된 규칙 기반 매핑 시작")
-        scores = {}
+        scores = defaultdict(float)
         
         # 1. LangExtract doc_types 우선 처리 (가장 높은 가중치)
         if langextract_result and langextract_result.get('doc_types'):
@@ -327,7 +442,7 @@ class DocTypeMapper:
                 best_match = self._find_best_document_match(doc_name)
                 if best_match:
                     code, confidence = best_match
-                    scores[code] = scores.get(code, 0) + confidence * 100  # 최고 가중치
+                    scores[code] += confidence * 100  # 최고 가중치
                     logger.info(f"  → 문서명 매칭: {code} (신뢰도: {confidence:.3f})")
 
         # 2. LangExtract keywords 처리
@@ -336,30 +451,69 @@ class DocTypeMapper:
                 kw_text = kw.get('text', '') if isinstance(kw, dict) else str(kw)
                 kw_lower = kw_text.lower()
                 
-                for mapping in self.fallback_mappings:
-                    for keyword in mapping.keywords:
-                        if keyword in kw_lower or kw_lower in keyword:
-                            if mapping.code not in scores:
-                                scores[mapping.code] = 0
-                            scores[mapping.code] += mapping.priority * 2  # 키워드 매칭
-                            logger.info(f"  → 키워드 매칭: {mapping.code} (키워드: {kw_text})")
+                # 매핑 키워드가 kw에 포함되거나 kw가 매핑 키워드에 포함된 경우 (매핑/키워드 순서대로 반영)
+                for mapping_idx, _ in self._find_related_keywords(kw_lower):
+                    code, weight = self._keyword_match_weights[mapping_idx]
+                    scores[code] += weight  # 키워드 매칭
+                    logger.info(f"  → 키워드 매칭: {code} (키워드: {kw_text})")
 
         # 3. 원본 쿼리에서도 매핑 (낮은 가중치)
-        query_lower = query.lower()
-        for mapping in self.fallback_mappings:
-            for keyword in mapping.keywords:
-                if keyword in query_lower:
-                    if mapping.code not in scores:
-                        scores[mapping.code] = 0
-                    scores[mapping.code] += mapping.priority * 0.5  # 낮은 가중치
+        self._add_query_keyword_scores(scores, self._find_keywords_in(query.lower()))
+        
+        return self._rank_scores(scores, max_types)
+
+    def map_queries_batch(self, queries: List[str], max_types: int = 3) -> List[List[Tuple[str, float]]]:
+        """
+        여러 쿼리를 규칙 기반으로 한 번에 매핑 (쿼리 키워드만 사용, LLM/LangExtract 미사용)
+        
+        오토마톤이 있으면 쿼리들을 구분자로 이어 붙여 1회 스캔한 뒤 매칭 위치로 쿼리별로 나눔
         
+        Args:
+            queries: 사용자 쿼리 리스트
+            max_types: 쿼리별 최대 반환 개수
+            
+        Returns:
+            queries 순서와 동일한 [(문서유형코드, 신뢰도)] 리스트의 리스트
+        """
+        queries_lower = [query.lower() for query in queries]
+        
+        if self._keyword_automaton is None:
+            hits_per_query = [self._find_keywords_in(query_lower) for query_lower in queries_lower]
+        else:
+            # 쿼리 i는 [ends[i-1], ends[i] - 1) 구간 (구분자 포함 누적 길이), 키워드에는 구분자가 없어 경계를 넘는 매칭은 없음
+            ends = list(accumulate(len(query_lower) + 1 for query_lower in queries_lower))
+            hit_sets = [set() for _ in queries_lower]
+            for end_index, pairs in self._keyword_automaton.iter(_BATCH_SEPARATOR.join(queries_lower)):
+                hit_sets[bisect_right(ends, end_index)].update(pairs)
+            hits_per_query = [tuple(sorted(hits)) for hits in hit_sets]
+        
+        results = []
+        for hits in hits_per_query:
+            scores = defaultdict(float)
+            self._add_query_keyword_scores(scores, hits)
+            results.append(self._rank_scores(scores, max_types))
+        return results
+
+    def _add_query_keyword_scores(self, scores: DefaultDict[str, float], hits: Tuple[Tuple[int, int], ...]) -> None:
+        """쿼리에서 찾은 (매핑 인덱스, 키워드 인덱스)마다 매핑 우선순위의 절반을 점수에 더함"""
+        weights = self._query_match_weights
+        for mapping_idx, _ in hits:
+            code, weight = weights[mapping_idx]
+            scores[code] += weight  # 낮은 가중치
+
+    def _rank_scores(self, scores: Dict[str, float], max_types: int) -> List[Tuple[str, float]]:
+        """최고 점수 기준으로 정규화 후 상위 max_types개 반환 (점수가 없으면 기본값)"""
         # 점수 정규화 및 정렬
         if scores:
             max_score = max(scores.values())
-            results = [(code, min(score/max_score, 1.0)) for code, score in scores.items()]
-            results.sort(key=lambda x: x[1], reverse=True)
-            logger.info(f"향상된 규칙 매핑 결과: {results[:max_types]}")
-            return results[:max_types]
+            # 상위 max_types개만 선택 (같은 점수는 먼저 점수가 매겨진 순서 유지)
+            results = heapq.nlargest(
+                max_types,
+                ((code, min(score/max_score, 1.0)) for code, score in scores.items()),
+                key=lambda x: x[1]
+            )
+            logger.info(f"향상된 규칙 매핑 결과: {results}")
+            return results
         
         # 결과가 없으면 기본값 반환
         logger.warning("향상된 규칙 매핑 실패, 기본값 사용: B001 (주요사항보고서)")
@@ -375,77 +529,26 @@ class DocTypeMapper:
         Returns:
             (코드, 신뢰도) 또는 None
         """
-        best_match = None
-        best_score = 0.0
+        # 1. 매핑명과 정확히 일치 (1.0)
+        code = self._name_lower_to_code.get(doc_name)
+        if code is not None:
+            return (code, 1.0)
         
-        for mapping in self.fallback_mappings:
-            mapping_name_lower = mapping.name.lower()
-            
-            # 정확한 매칭
-            if doc_name == mapping_name_lower or doc_name in mapping_name_lower or mapping_name_lower in doc_name:
-                confidence = 1.0 if doc_name == mapping_name_lower else 0.9
-                if confidence > best_score:
-                    best_match = (mapping.code, confidence)
-                    best_score = confidence
-                    
-            # 키워드 매칭
-            for keyword in mapping.keywords:
-                if keyword in doc_name or doc_name in keyword:
-                    confidence = 0.8
-                    if confidence > best_score:
-                        best_match = (mapping.code, confidence)
-                        best_score = confidence
-        
-        return best_match
+        # 2. 매핑명 포함 관계 (0.9, 앞선 매핑 우선)
+        for name_lower, code in self._names_lower:
+            if doc_name in name_lower or name_lower in doc_name:
+                return (code, 0.9)
+        
+        # 3. 키워드 포함 관계 (0.8, 앞선 매핑 우선)
+        matched = self._find_related_keywords(doc_name)
+        if matched:
+            mapping_idx, _ = matched[0]
+            return (self.fallback_mappings[mapping_idx].code, 0.8)
+        
+        return None
     
     
-    def get_doc_type_name(self, code: str) -> str:
+    @staticmethod
+    def get_doc_type_name(code: str) -> str:
         """문서유형 코드의 이름 반환"""
-        doc_names = {
-            # A: 정기보고서
-            "A001": "사업보고서", "A002": "반기보고서", "A003": "분기보고서",
-            "A004": "등록법인결산서류", "A005": "소액공모법인결산서류",
-            
-            # B: 주요사항보고서
-            "B001": "주요사항보고서", "B002": "주요경영사항신고", "B003": "최대주주등과의거래신고",
-            
-            # C: 증권신고서
-            "C001": "증권신고(지분증권)", "C002": "증권신고(채무증권)", "C003": "증권신고(파생결합증권)",
-            "C004": "증권신고(합병등)", "C005": "증권신고(기타)", "C006": "소액공모(지분증권)",
-            "C007": "소액공모(채무증권)", "C008": "소액공모(파생결합증권)", "C009": "소액공모(합병등)",
-            "C010": "소액공모(기타)", "C011": "호가중개시스템을통한소액매출",
-            
-            # D: 지분공시
-            "D001": "주식등의대량보유상황보고서", "D002": "임원ㆍ주요주주특정증권등소유상황보고서",
-            "D003": "의결권대리행사권유", "D004": "공개매수", "D005": "임원ㆍ주요주주특정증권등거래계획보고서",
-            
-            # E: 기타주요공시
-            "E001": "자기주식취득/처분", "E002": "신탁계약체결/해지", "E003": "합병등종료보고서",
-            "E004": "주식매수선택권부여에관한신고", "E005": "사외이사에관한신고", "E006": "주주총회소집보고서",
-            "E007": "시장조성/안정조작", "E008": "합병등신고서", "E009": "금융위등록/취소",
-            "E010": "이중상환청구권부채권(커버드본드)",
-            
-            # F: 감사보고서
-            "F001": "감사보고서", "F002": "연결감사보고서", "F003": "결합감사보고서",
-            "F004": "회계법인사업보고서", "F005": "감사전재무제표미제출신고서",
-            
-            # G: 집합투자
-            "G001": "증권신고(집합투자증권-신탁형)", "G002": "증권신고(집합투자증권-회사형)",
-            "G003": "증권신고(집합투자증권-합병)",
-            
-            # H: 자산유동화
-            "H001": "자산유동화계획/양도등록", "H002": "사업/반기/분기보고서",
-            "H003": "증권신고(유동화증권등)", "H004": "채권유동화계획/양도등록",
-            "H005": "자산유동화관련중요사항발생등보고", "H006": "주요사항보고서",
-            
-            # I: 거래소공시
-            "I001": "수시공시", "I002": "공정공시", "I003": "시장조치/안내",
-            "I004": "지분공시", "I005": "증권투자회사", "I006": "채권공시",
-            
-            # J: 공정위공시
-            "J001": "대규모내부거래관련", "J002": "대규모내부거래관련(구)",
-            "J004": "기업집단현황공시", "J005": "비상장회사중요사항공시",
-            "J006": "기타공정위공시", "J008": "대규모내부거래관련(공익법인용)",
-            "J009": "하도급대금결제조건공시"
-        }
-        return doc_names.get(code, code)
\ No newline at end of file
+        return _DOC_NAMES.get(code, code)
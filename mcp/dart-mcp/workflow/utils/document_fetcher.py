@@ -602,7 +602,8 @@ class DocumentFetcherV2:
         self,
         documents: List[Dict[str, Any]],
         max_concurrent: int = 3,
-        detailed_types: Dict[str, List[str]] = None
+        detailed_types: Dict[str, List[str]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None
     ) -> List[Dict[str, Any]]:
         """
         여러 문서 동시 가져오기 (검색 결과 기반)
@@ -611,55 +612,69 @@ class DocumentFetcherV2:
             documents: 검색 결과 문서 리스트 (rcept_no, corp_code, report_type 포함)
             max_concurrent: 동시 처리 수
             detailed_types: 상세 문서 타입 딕셔너리
+            semaphore: 여러 호출이 공유하는 동시 요청 제한 (없으면 max_concurrent만 적용)
             
         Returns:
             문서 내용 리스트
         """
-        results = []
+        # 작업 큐 + 워커 풀 (배치 단위로 기다리지 않고, 한 문서가 끝나면 바로 다음 문서를 가져옴)
+        queue: asyncio.Queue = asyncio.Queue()
+        for item in enumerate(documents):
+            queue.put_nowait(item)
         
-        # 배치 처리
-        for i in range(0, len(documents), max_concurrent):
-            batch = documents[i:i + max_concurrent]
-            
-            # 동시 처리
-            tasks = []
-            for doc in batch:
-                rcept_no = doc.get("rcept_no") or doc.get("rcp_no")
-                corp_code = doc.get("corp_code")
-                # orchestrator에서 전달된 report_type 우선 사용, 없으면 추론
-                report_type = doc.get("report_type") or self._infer_report_type(doc)
-                
-                tasks.append(
-                    self.fetch_document_content(
-                        rcept_no=rcept_no,
-                        corp_code=corp_code,
-                        report_type=report_type,
-                        fetch_mode="auto",  # auto로 변경하여 실패시 원본 문서로 폴백
-                        detailed_types=detailed_types
-                    )
-                )
-            
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            for doc, result in zip(batch, batch_results):
-                if isinstance(result, Exception):
-                    logger.error(f"Failed to fetch {doc.get('rcept_no')}: {result}")
-                    results.append({
-                        "rcept_no": doc.get("rcept_no"),
-                        "content": None,
-                        "error": str(result)
-                    })
-                else:
-                    # 원본 문서 정보와 병합
-                    result.update({
-                        "corp_name": doc.get("corp_name"),
-                        "report_nm": doc.get("report_nm"),
-                        "rcept_dt": doc.get("rcept_dt")
-                    })
-                    results.append(result)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(documents)
+        
+        async def _worker() -> None:
+            while True:
+                try:
+                    idx, doc = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                if semaphore is None:
+                    results[idx] = await self._fetch_search_result(doc, detailed_types)
+                    continue
+                async with semaphore:
+                    results[idx] = await self._fetch_search_result(doc, detailed_types)
+        
+        await asyncio.gather(*[_worker() for _ in range(min(max_concurrent, len(documents)))])
         
         return results
     
+    async def _fetch_search_result(
+        self,
+        doc: Dict[str, Any],
+        detailed_types: Optional[Dict[str, List[str]]]
+    ) -> Dict[str, Any]:
+        """검색 결과 문서 하나의 내용 가져오기 (실패 시 에러 정보 반환)"""
+        rcept_no = doc.get("rcept_no") or doc.get("rcp_no")
+        corp_code = doc.get("corp_code")
+        # orchestrator에서 전달된 report_type 우선 사용, 없으면 추론
+        report_type = doc.get("report_type") or self._infer_report_type(doc)
+        
+        try:
+            result = await self.fetch_document_content(
+                rcept_no=rcept_no,
+                corp_code=corp_code,
+                report_type=report_type,
+                fetch_mode="auto",  # auto로 변경하여 실패시 원본 문서로 폴백
+                detailed_types=detailed_types
+            )
+        except Exception as e:
+            logger.error(f"Failed to fetch {doc.get('rcept_no')}: {e}")
+            return {
+                "rcept_no": doc.get("rcept_no"),
+                "content": None,
+                "error": str(e)
+            }
+        
+        # 원본 문서 정보와 병합
+        result.update({
+            "corp_name": doc.get("corp_name"),
+            "report_nm": doc.get("report_nm"),
+            "rcept_dt": doc.get("rcept_dt")
+        })
+        return result
+    
     def _infer_report_type(self, doc: Dict[str, Any]) -> Optional[str]:
         """문서 정보에서 보고서 유형 추론"""
         report_nm = doc.get("report_nm", "").lower()
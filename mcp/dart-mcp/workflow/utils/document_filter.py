@@ -7,10 +7,18 @@ import json
 import re
 from pathlib import Path
 from typing import List, Dict, Any, Optional
+from utils.cache import get_cache
 from utils.logging import get_logger
 
 logger = get_logger("document_filter")
 
+# 필터링 캐시 버전 (프롬프트/선별 로직을 바꾸면 올려서 이전 결과 무효화)
+_FILTER_CACHE_VERSION = "v1"
+
+# LLM으로 필터링하는 최대 문서 수 / 배치 크기
+_MAX_TO_FILTER = 100
+_BATCH_SIZE = 100
+
 
 class DocumentFilter:
     """DART 문서 필터링 클래스"""
@@ -22,6 +30,7 @@ class DocumentFilter:
         """
         self.llm_client = llm_client
         self.prompt_template = self._load_prompt_template()
+        self.cache = get_cache()
     
     async def filter_documents(
         self,
@@ -122,13 +131,34 @@ class DocumentFilter:
         search_results: List[Dict[str, Any]],
         expanded_query: Dict[str, Any]
     ) -> List[Dict[str, Any]]:
-        """LLM 기반 문서 필터링"""
+        """LLM 기반 문서 필터링 (같은 질의·문서 목록이면 캐시된 선별 결과 재사용)"""
+        import os
+        model_name = os.getenv("LLM_MODEL", "gpt-3.5-turbo")
+        max_to_filter = min(_MAX_TO_FILTER, len(search_results))  # 최대 100개만 필터링
+        
         try:
-            filtered_docs = []
-            batch_size = 100  # 배치 처리를 위한 크기
-            max_to_filter = min(100, len(search_results))  # 최대 100개만 필터링
+            # 캐시 키: LLM이 보는 입력(질의, 확장 쿼리, 문서 요약 필드)과 모델/프롬프트
+            cache_params = {
+                "version": _FILTER_CACHE_VERSION,
+                "model": model_name,
+                "prompt_template": self.prompt_template,
+                "query": query,
+                "expanded_query": expanded_query,
+                "docs": [
+                    [doc.get("_uid"), doc.get("report_nm", ""), doc.get("corp_name", ""), doc.get("rcept_dt", "")]
+                    for doc in search_results[:max_to_filter]
+                ]
+            }
+            cached_indices = await self.cache.get("filter_documents", cache_params)
+            if cached_indices is not None:
+                logger.info(f"Filter cache hit: {len(cached_indices)}/{len(search_results)} documents selected")
+                return [search_results[idx] for idx in cached_indices]
             
-            for i in range(0, min(max_to_filter, len(search_results)), batch_size):
+            selected_indices = []
+            all_parsed = True  # 모든 배치 응답을 파싱했는지 (fallback 결과는 캐시하지 않음)
+            batch_size = _BATCH_SIZE  # 배치 처리를 위한 크기
+            
+            for i in range(0, max_to_filter, batch_size):
                 batch = search_results[i:i+batch_size]
                 
                 # 배치 문서 정보 준비
@@ -172,9 +202,6 @@ class DocumentFilter:
                     """
                 
                 # LLM 호출
-                import os
-                model_name = os.getenv("LLM_MODEL", "gpt-3.5-turbo")
-                
                 response = self.llm_client.chat.completions.create(
                     model=model_name,
                     messages=[
@@ -200,7 +227,7 @@ class DocumentFilter:
                     # 선별된 문서 추가
                     for idx in relevant_indices:
                         if 0 <= idx < len(batch):
-                            filtered_docs.append(batch[idx])
+                            selected_indices.append(i + idx)
                     
                     logger.info(f"Batch filtering: {len(relevant_indices)}/{len(batch)} documents selected. "
                                f"Reason: {parsed_result.get('reason', 'N/A')}")
@@ -208,14 +235,17 @@ class DocumentFilter:
                     # 파싱 실패시 상위 문서 포함
                     logger.warning(f"Failed to parse filter response: {response_text[:200]}...")
                     logger.warning("Including top documents as fallback")
-                    filtered_docs.extend(batch[:5])
+                    all_parsed = False
+                    selected_indices.extend(range(i, i + min(5, len(batch))))
             
             # 필터링 결과가 없으면 상위 N개 반환
-            if not filtered_docs and search_results:
+            if not selected_indices and search_results:
                 logger.warning("No documents passed filtering, returning top 5")
-                return search_results[:5]
-            
-            return filtered_docs
+                selected_indices = list(range(min(5, len(search_results))))
+            elif all_parsed:
+                # LLM이 실제로 선별한 결과만 캐시
+                await self.cache.set("filter_documents", cache_params, selected_indices)
+            return [search_results[idx] for idx in selected_indices]
             
         except Exception as e:
             logger.error(f"LLM filtering error: {e}")
@@ -5,15 +5,13 @@ LangExtract 쿼리 파서
 
 from typing import Dict, List, Optional, Any
 import re
+import importlib.util
 from pathlib import Path
 import json
 
-# LangExtract import
-try:
-    import langextract as lx
-    LANGEXTRACT_AVAILABLE = True
-except ImportError:
-    LANGEXTRACT_AVAILABLE = False
+# LangExtract 설치 여부만 확인 (무거운 import는 실제 추출 시점으로 미룸)
+LANGEXTRACT_AVAILABLE = importlib.util.find_spec("langextract") is not None
+if not LANGEXTRACT_AVAILABLE:
     print("⚠️ LangExtract가 설치되지 않았습니다. pip install langextract")
 
 
@@ -132,6 +130,8 @@ class QueryParserLangExtract:
     
     def _create_example(self, text: str, extractions: List[Dict]) -> Any:
         """LangExtract 예제 데이터 생성"""
+        import langextract as lx
+        
         extraction_objects = []
         for ext in extractions:
             extraction_objects.append(
@@ -169,6 +169,7 @@ class QueryParserLangExtract:
     
     def _parse_with_langextract(self, query: str) -> Dict[str, Any]:
         """LangExtract를 사용한 파싱"""
+        import langextract as lx
         
         # LangExtract로 정보 추출
         if self.use_ollama: